@@ -6,8 +6,13 @@ using RQ (Redis Queue). Heavy operations like LLM calls, story generation,
 revisions, and batch exports are moved here to prevent blocking the web server.
 """
 
+import os
+import re
+import uuid
 import logging
+import tempfile
 import traceback
+from io import BytesIO
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -95,7 +100,6 @@ def generate_story_job(
         story_word_count = pipeline.word_validator.count_words(revised_story_text)
         
         # Generate story ID
-        import uuid
         story_id = f"story_{uuid.uuid4().hex[:8]}"
         
         # Build story metadata
@@ -292,7 +296,6 @@ def export_story_job(
             raise ValidationError("Story has no content to export")
         
         # Extract title
-        import re
         title_match = re.search(r'^#\s+(.+)$', story_text, re.MULTILINE)
         if title_match:
             raw_title = title_match.group(1)
@@ -310,9 +313,6 @@ def export_story_job(
         
         # Generate export content based on format
         # Since export functions return Flask responses, we generate content directly
-        import tempfile
-        import os
-        from io import BytesIO
         
         # Create temporary file
         with tempfile.NamedTemporaryFile(delete=False, suffix=f".{format_type}") as tmp_file:
@@ -7,7 +7,8 @@ See CONCEPTS.md for core principles and terminology.
 
 import re
 import logging
-from typing import Optional, Dict, Any
+import functools
+from typing import Optional, Dict, Any, Tuple
 
 from .models import (
     PremiseModel,
@@ -27,10 +28,153 @@ from .utils.llm import (
     generate_outline_structure,
     generate_scaffold_structure,
 )
+from .utils.story_prompt_builder import Tone, Pace
 from .genres import get_genre_config
+from .cliche_detector import get_cliche_detector
+from .memorability_scorer import get_memorability_scorer
+from .voice_analyzer import check_voice_consistency_across_stages
 
 logger = logging.getLogger(__name__)
 
+# Act labels used when a genre defines fewer than three outline beats
+_DEFAULT_OUTLINE_STRUCTURE = ("setup", "complication", "resolution")
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_outline_labels(genre: Optional[str]) -> Tuple[Tuple[str, ...], Tuple[str, str, str], str]:
+    """
+    Resolve the outline structure, act labels and framework for a genre.
+    
+    Genre configs are static, so the result is cached per genre name and
+    repeated outlines for the same genre skip the lookups and fallbacks.
+    
+    Args:
+        genre: Genre name (None for no genre)
+        
+    Returns:
+        Tuple of (structure, (beginning, middle, end), framework)
+    """
+    genre_config = (get_genre_config(genre) or {}) if genre else {}
+    structure = tuple(genre_config.get("outline", _DEFAULT_OUTLINE_STRUCTURE))
+    first_three = structure[:3]
+    beginning, middle, end = first_three + _DEFAULT_OUTLINE_STRUCTURE[len(first_three):]
+    return structure, (beginning, middle, end), genre_config.get("framework", "narrative_arc")
+
+
+# Rule-based revision tables. The combined patterns are compiled once at import
+# instead of on every _apply_rule_based_revisions call.
+_CLICHE_REPLACEMENTS: Dict[str, str] = {
+    "dark and stormy night": "a night that swallowed sound",
+    "once upon a time": "it began",
+    "in the nick of time": "just as the moment shifted",
+    "all hell broke loose": "everything fractured",
+    "calm before the storm": "the pause before change",
+    "needle in a haystack": "something nearly impossible to find",
+    "tip of the iceberg": "only the surface",
+    "dead as a doornail": "completely still",
+    "raining cats and dogs": "rain that pounded",
+    "piece of cake": "effortless",
+    "blessing in disguise": "something that seemed wrong but wasn't",
+    "beat around the bush": "avoid the point",
+    "break the ice": "create connection",
+    "hit the nail on the head": "exactly right",
+    "let the cat out of the bag": "reveal the secret",
+}
+
+_VAGUE_REPLACEMENTS: Dict[str, str] = {
+    " very ": " ",
+    " really ": " ",
+    " quite ": " ",
+    " somewhat ": " ",
+    " kind of ": " ",
+    " sort of ": " ",
+}
+
+# Clichés (case-insensitive, longest first to avoid partial matches) and vague
+# language (case-sensitive) are matched in one pass. Neither replacement can
+# create a match for the other, so this is equivalent to two passes.
+_WORD_CHOICE_PATTERN = re.compile(
+    "(?i:"
+    + "|".join(re.escape(cliche) for cliche in sorted(_CLICHE_REPLACEMENTS, key=len, reverse=True))
+    + ")|"
+    + "|".join(re.escape(vague) for vague in _VAGUE_REPLACEMENTS)
+)
+
+# Redundant phrases run as a separate pass after vague language is removed,
+# since dropping " very " can complete a phrase ("the very fact that").
+# Order matters: longer phrases must be replaced first to avoid partial matches
+_REDUNDANT_PHRASES: Dict[str, str] = {
+    "due to the fact that": "because",
+    "the fact that": "that",
+    "in order to": "to",
+}
+
+_REDUNDANT_PATTERN = re.compile(
+    "|".join(re.escape(phrase) for phrase in sorted(_REDUNDANT_PHRASES, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+def _replace_word_choice(match: "re.Match[str]") -> str:
+    """Return the replacement for a matched cliché or vague phrase."""
+    matched_text = match.group(0)
+    if matched_text in _VAGUE_REPLACEMENTS:
+        return _VAGUE_REPLACEMENTS[matched_text]
+    # Clichés match case-insensitively, so look them up lowercased
+    return _CLICHE_REPLACEMENTS.get(matched_text.lower(), matched_text)
+
+
+def _replace_redundant(match: "re.Match[str]") -> str:
+    """Return the replacement for a matched redundant phrase (case-insensitive lookup)."""
+    return _REDUNDANT_PHRASES.get(match.group(0).lower(), match.group(0))
+
+
+# Paragraphs used to expand the template draft toward its target length. Only
+# the {name}, {pronoun}, {possessive} and {pronoun_title} fields vary per call,
+# and only the paragraphs actually appended are formatted.
+_TEMPLATE_EXPANSION_SECTIONS: Tuple[Tuple[str, ...], ...] = (
+    (
+        "The story continued to unfold, revealing layers of complexity that had been hidden beneath the surface.",
+        "{name} discovered that every action had consequences, every choice opened new paths while closing others.",
+    ),
+    (
+        "In the quiet moments between the dramatic events, there were opportunities for reflection.",
+        "The character grappled with {possessive} own nature, questioning assumptions and discovering hidden strengths.",
+        "These internal struggles were as important as the external conflicts, shaping the character's growth throughout the narrative.",
+    ),
+    (
+        "The world around {pronoun} responded to {possessive} choices, creating ripples that extended far beyond {possessive} immediate awareness.",
+        "Other characters entered and left the story, each bringing their own perspectives and challenges.",
+        "These interactions deepened the narrative, adding texture and complexity to the central story.",
+    ),
+    (
+        "As the story progressed, the stakes continued to rise.",
+        "What had begun as a simple situation evolved into something more profound, testing the character's resolve and forcing difficult decisions.",
+        "Each challenge revealed new aspects of the character's personality, showing both strengths and vulnerabilities.",
+    ),
+    (
+        "The resolution came gradually, not as a sudden revelation but as a series of realizations that built upon each other.",
+        "The character came to understand that some questions don't have simple answers, and that growth often comes from accepting complexity rather than seeking clarity.",
+    ),
+)
+
+# Filler rotated in when the expansion sections are not enough
+_TEMPLATE_FILLER_PARAGRAPHS: Tuple[str, ...] = (
+    (
+        "\n\nThe narrative wove together multiple threads, each contributing to the overall tapestry of the story. "
+        "{name} navigated through challenges both internal and external, "
+        "learning that the journey itself was as important as the destination.\n\n"
+    ),
+    (
+        "\n\nThe story continued to develop, revealing new dimensions and deepening the reader's understanding of the characters and their world. "
+        "Each scene built upon the previous ones, creating a rich and immersive narrative experience.\n\n"
+    ),
+    (
+        "\n\n{pronoun_title} reflected on the path that had led to this moment, recognizing how each decision had shaped the outcome. "
+        "The themes of the story resonated more deeply now, having been tested through experience.\n\n"
+    ),
+)
+
 
 class ShortStoryPipeline:
     """
@@ -141,9 +285,7 @@ class ShortStoryPipeline:
         
         # Get genre-specific outline structure
         genre_config = self._get_genre_config(genre)
-        # genre_config is always a dict (never None)
-        outline_structure = genre_config.get("outline", ["setup", "complication", "resolution"])
-        framework = genre_config.get("framework", "narrative_arc")
+        outline_structure, (beginning_label, middle_label, end_label), framework = _resolve_outline_labels(genre)
         
         # Extract premise elements (handle both PremiseModel and dict for backward compatibility)
         if isinstance(premise, PremiseModel):
@@ -186,18 +328,20 @@ class ShortStoryPipeline:
         )
         
         # Validate outline against predictable beats
-        from .cliche_detector import get_cliche_detector
         cliche_detector = get_cliche_detector()
         
         # Check for predictable beats in the outline
-        outline_text = f"{detailed_outline.get('beginning', {}).get('hook', '')} {detailed_outline.get('middle', {}).get('complication', '')} {detailed_outline.get('end', {}).get('resolution', '')}"
+        outline_beginning = detailed_outline.get("beginning", {})
+        outline_middle = detailed_outline.get("middle", {})
+        outline_end = detailed_outline.get("end", {})
+        outline_text = f"{outline_beginning.get('hook', '')} {outline_middle.get('complication', '')} {outline_end.get('resolution', '')}"
         beat_check = cliche_detector._detect_predictable_beats(outline_text)
         
         # Build OutlineModel
         acts = {
-            "beginning": outline_structure[0] if len(outline_structure) > 0 else "setup",
-            "middle": outline_structure[1] if len(outline_structure) > 1 else "complication",
-            "end": outline_structure[2] if len(outline_structure) > 2 else "resolution"
+            "beginning": beginning_label,
+            "middle": middle_label,
+            "end": end_label,
         }
         
         # Ensure genre is a string (default to "General Fiction" if None)
@@ -206,16 +350,16 @@ class ShortStoryPipeline:
         self.outline = OutlineModel(
             genre=genre_str,
             framework=framework,
-            structure=outline_structure,
+            structure=list(outline_structure),
             acts=acts,
         )
         
         # Store detailed outline data in a separate dict for backward compatibility
         # (OutlineModel doesn't include all the detailed beats, so we keep them accessible)
         self._outline_details = {
-            "beginning": detailed_outline.get("beginning", {}),
-            "middle": detailed_outline.get("middle", {}),
-            "end": detailed_outline.get("end", {}),
+            "beginning": outline_beginning,
+            "middle": outline_middle,
+            "end": outline_end,
             "memorable_moments": detailed_outline.get("memorable_moments", []),
             "voice_opportunities": detailed_outline.get("voice_opportunities", []),
             "beat_validation": {
@@ -289,13 +433,19 @@ class ShortStoryPipeline:
         else:
             character_info = None
         
+        # Look up each scaffold section once and reuse it below
+        character_voices = detailed_scaffold.get("character_voices", {})
+        narrative_voice = detailed_scaffold.get("narrative_voice", {})
+        sensory_specificity = detailed_scaffold.get("sensory_specificity", {})
+        
         # If we have character info, enhance voice profiles
-        if character_info and detailed_scaffold.get("character_voices"):
-            char_name = character_info.get("name", list(detailed_scaffold.get("character_voices", {}).keys())[0] if detailed_scaffold.get("character_voices") else "character")
+        if character_info and character_voices:
+            # Fall back to the first voice profile only when the character is unnamed
+            char_name = character_info["name"] if "name" in character_info else next(iter(character_voices))
             
             # Add voice markers from character quirks and contradictions
-            if char_name in detailed_scaffold["character_voices"]:
-                voice_profile = detailed_scaffold["character_voices"][char_name]
+            if char_name in character_voices:
+                voice_profile = character_voices[char_name]
                 
                 # Add quirks as voice markers
                 quirks = character_info.get("quirks", [])
@@ -320,10 +470,8 @@ class ShortStoryPipeline:
                     voice_profile["distinctive_traits"] = existing_traits
         
         # Extract metadata fields for StoryMetadata
-        # Import enums for default values
-        from .utils.story_prompt_builder import Tone, Pace
-        
-        pov = detailed_scaffold.get("narrative_voice", {}).get("pov", constraints.get("pov_preference", "flexible")) if isinstance(detailed_scaffold.get("narrative_voice"), dict) else constraints.get("pov_preference", "flexible")
+        pov_default = constraints.get("pov_preference", "flexible")
+        pov = narrative_voice.get("pov", pov_default) if isinstance(narrative_voice, dict) else pov_default
         # Use enum values as defaults, but accept strings from dicts
         tone_default = constraints.get("tone", Tone.BALANCED.value)
         # Handle both string and dict formats for tone
@@ -354,11 +502,11 @@ class ShortStoryPipeline:
             "constraints": constraints,
             "framework": genre_config.get("framework", "narrative_arc"),
             # Detailed voice development
-            "narrative_voice": detailed_scaffold.get("narrative_voice", {}),
-            "character_voices": detailed_scaffold.get("character_voices", {}),
+            "narrative_voice": narrative_voice,
+            "character_voices": character_voices,
             "tone_detail": detailed_scaffold.get("tone", {}),  # Full tone dict
             "conflicts": detailed_scaffold.get("conflicts", {}),
-            "sensory_specificity": detailed_scaffold.get("sensory_specificity", {}),
+            "sensory_specificity": sensory_specificity,
             "style_guidelines": detailed_scaffold.get("style_guidelines", {}),
             # Use StoryMetadata for validated metadata fields
             "metadata": metadata,
@@ -367,7 +515,7 @@ class ShortStoryPipeline:
             "tone": metadata.tone,
             "pace": metadata.pace,
             "voice": "developed",  # Indicates voice has been developed
-            "sensory_focus": detailed_scaffold.get("sensory_specificity", {}).get("primary_senses", constraints.get("sensory_focus", ["balanced"])),
+            "sensory_focus": sensory_specificity.get("primary_senses", constraints.get("sensory_focus", ["balanced"])),
             # Explicit reminder: distinctiveness is non-negotiable
             "distinctiveness_required": True,
             "anti_generic_enforced": True,
@@ -494,7 +642,8 @@ class ShortStoryPipeline:
         """
         # Get character description
         if isinstance(character, dict):
-            char_desc = character.get("description", str(character))
+            # Only stringify the whole character when it has no description
+            char_desc = character["description"] if "description" in character else str(character)
             char_name = character.get("name", "the character")
             char_quirks = character.get("quirks", [])
             char_contradictions = character.get("contradictions", "")
@@ -524,10 +673,11 @@ class ShortStoryPipeline:
         pov = scaffold.get("pov", "flexible")
         
         # Determine POV pronouns
-        if "first" in pov.lower():
+        pov_lower = pov.lower()
+        if "first" in pov_lower:
             pov_pronoun = "I"
             pov_possessive = "my"
-        elif "second" in pov.lower():
+        elif "second" in pov_lower:
             pov_pronoun = "you"
             pov_possessive = "your"
         else:
@@ -566,12 +716,12 @@ class ShortStoryPipeline:
             story_parts.append(f"{char_contradictions}\n\n")
         
         # Add complication based on genre
-        genre = outline_genre
-        if "horror" in genre.lower():
+        genre_lower = outline_genre.lower()
+        if "horror" in genre_lower:
             story_parts.append("Something shifted. The familiar became strange, the safe became uncertain.\n\n")
-        elif "romance" in genre.lower():
+        elif "romance" in genre_lower:
             story_parts.append("Connection sparked, then faltered. The space between closeness and distance narrowed.\n\n")
-        elif "crime" in genre.lower() or "noir" in genre.lower():
+        elif "crime" in genre_lower or "noir" in genre_lower:
             story_parts.append("The pieces didn't fit. Every answer raised new questions.\n\n")
         else:
             story_parts.append("The situation deepened. What seemed simple revealed hidden layers.\n\n")
@@ -595,90 +745,48 @@ class ShortStoryPipeline:
             story_parts.append("But now it was no longer just a question—it was a lived experience, a truth discovered through the telling of the story itself.\n\n")
         
         # Expand the story to reach a reasonable length (2000+ words)
-        # Use list-based approach throughout for better performance
-        # Cache joined string to avoid repeated joins during word counting
-        joined_text = "".join(story_parts)
-        current_words = self.word_validator.count_words(joined_text)
+        # Every appended paragraph starts with whitespace, so the running word
+        # count is updated per paragraph instead of re-joining the whole draft
+        count_words = self.word_validator.count_words
+        current_words = count_words("".join(story_parts))
         target_words = max(2000, int(self.word_validator.max_words * 0.3))  # At least 2000 words or 30% of max
         
         if current_words < target_words:
-            # Define expansion sections as structured data for better maintainability
-            expansion_sections = [
-                [
-                    "The story continued to unfold, revealing layers of complexity that had been hidden beneath the surface.",
-                    f"{char_name if char_name != 'the character' else 'The character'} discovered that every action had consequences, every choice opened new paths while closing others."
-                ],
-                [
-                    "In the quiet moments between the dramatic events, there were opportunities for reflection.",
-                    f"The character grappled with {pov_possessive} own nature, questioning assumptions and discovering hidden strengths.",
-                    "These internal struggles were as important as the external conflicts, shaping the character's growth throughout the narrative."
-                ],
-                [
-                    f"The world around {pov_pronoun} responded to {pov_possessive} choices, creating ripples that extended far beyond {pov_possessive} immediate awareness.",
-                    "Other characters entered and left the story, each bringing their own perspectives and challenges.",
-                    "These interactions deepened the narrative, adding texture and complexity to the central story."
-                ],
-                [
-                    "As the story progressed, the stakes continued to rise.",
-                    "What had begun as a simple situation evolved into something more profound, testing the character's resolve and forcing difficult decisions.",
-                    "Each challenge revealed new aspects of the character's personality, showing both strengths and vulnerabilities."
-                ],
-                [
-                    "The resolution came gradually, not as a sudden revelation but as a series of realizations that built upon each other.",
-                    "The character came to understand that some questions don't have simple answers, and that growth often comes from accepting complexity rather than seeking clarity."
-                ]
-            ]
+            # Values substituted into the module-level expansion templates
+            template_fields = {
+                "name": char_name if char_name != 'the character' else 'The character',
+                "pronoun": pov_pronoun,
+                "possessive": pov_possessive,
+                "pronoun_title": pov_pronoun.capitalize(),
+            }
             
             # Add expansion sections until target is met
-            # Only rejoin and count words periodically to improve performance
-            for section in expansion_sections:
+            for section in _TEMPLATE_EXPANSION_SECTIONS:
                 if current_words >= target_words:
                     break
                 for paragraph in section:
                     if current_words >= target_words:
                         break
-                    story_parts.append(f"\n\n{paragraph}")
-                    # Only count words every few additions to reduce overhead
-                    if len(story_parts) % 3 == 0:  # Count every 3 additions
-                        joined_text = "".join(story_parts)
-                        current_words = self.word_validator.count_words(joined_text)
-            
-            # Final word count check before filler
-            if current_words < target_words:
-                joined_text = "".join(story_parts)
-                current_words = self.word_validator.count_words(joined_text)
+                    paragraph_text = "\n\n" + paragraph.format(**template_fields)
+                    story_parts.append(paragraph_text)
+                    current_words += count_words(paragraph_text)
             
             # If still not enough, add contextual filler (with reasonable limit)
             if current_words < target_words:
-                filler_templates = [
-                    (
-                        f"\n\nThe narrative wove together multiple threads, each contributing to the overall tapestry of the story. "
-                        f"{char_name if char_name != 'the character' else 'The character'} navigated through challenges both internal and external, "
-                        f"learning that the journey itself was as important as the destination.\n\n"
-                    ),
-                    (
-                        "\n\nThe story continued to develop, revealing new dimensions and deepening the reader's understanding of the characters and their world. "
-                        "Each scene built upon the previous ones, creating a rich and immersive narrative experience.\n\n"
-                    ),
-                    (
-                        f"\n\n{pov_pronoun.capitalize()} reflected on the path that had led to this moment, recognizing how each decision had shaped the outcome. "
-                        f"The themes of the story resonated more deeply now, having been tested through experience.\n\n"
-                    ),
-                ]
+                filler_templates = [template.format(**template_fields) for template in _TEMPLATE_FILLER_PARAGRAPHS]
+                # Filler paragraphs repeat, so count each one once up front
+                filler_word_counts = [count_words(filler) for filler in filler_templates]
                 
                 max_filler_iterations = 20  # Prevent infinite loops
                 iteration = 0
                 template_index = 0
                 while current_words < target_words and iteration < max_filler_iterations:
                     # Rotate through filler templates for variety
-                    filler_template = filler_templates[template_index % len(filler_templates)]
-                    story_parts.append(filler_template)
+                    filler_index = template_index % len(filler_templates)
+                    story_parts.append(filler_templates[filler_index])
+                    current_words += filler_word_counts[filler_index]
                     template_index += 1
                     iteration += 1
-                    # Count words every 2 iterations to reduce overhead
-                    if iteration % 2 == 0:
-                        joined_text = "".join(story_parts)
-                        current_words = self.word_validator.count_words(joined_text)
         
         # Final join - only done once at the end
         return "".join(story_parts)
@@ -711,9 +819,6 @@ class ShortStoryPipeline:
             raise ValueError(f"Draft text must be a string, got {type(text).__name__}")
         
         # Check for clichés and generic language using comprehensive detection
-        from .cliche_detector import get_cliche_detector
-        from .memorability_scorer import get_memorability_scorer
-        
         cliche_detector = get_cliche_detector()
         
         # Extract character for cliche detection (handle both PremiseModel and dict)
@@ -806,7 +911,6 @@ class ShortStoryPipeline:
         revised_voice_analysis = validate_story_voices(revised_text, character_info)
         
         # Check voice consistency across draft stages
-        from .voice_analyzer import check_voice_consistency_across_stages
         voice_consistency_check = check_voice_consistency_across_stages(
             draft_analysis=voice_analysis,
             revised_analysis=revised_voice_analysis,
@@ -836,9 +940,9 @@ class ShortStoryPipeline:
         """
         Apply rule-based text revisions (fallback when LLM unavailable).
         
-        Uses optimized regex patterns to perform all replacements in a single pass
-        for better performance, especially with large texts. All replacements are
-        combined into single regex patterns to minimize passes through the text.
+        Uses the module-level patterns compiled once at import. Clichés and
+        vague language are replaced in a single pass, followed by one pass
+        for redundant phrases.
         
         Args:
             text: Text to revise
@@ -847,82 +951,8 @@ class ShortStoryPipeline:
         Returns:
             Revised text with clichés replaced and vague language removed
         """
-        revised_text = text
-        
-        # Replace common clichés with more specific language
-        # Combine all cliché replacements into a single regex pattern for efficiency
-        cliche_replacements = {
-            "dark and stormy night": "a night that swallowed sound",
-            "once upon a time": "it began",
-            "in the nick of time": "just as the moment shifted",
-            "all hell broke loose": "everything fractured",
-            "calm before the storm": "the pause before change",
-            "needle in a haystack": "something nearly impossible to find",
-            "tip of the iceberg": "only the surface",
-            "dead as a doornail": "completely still",
-            "raining cats and dogs": "rain that pounded",
-            "piece of cake": "effortless",
-            "blessing in disguise": "something that seemed wrong but wasn't",
-            "beat around the bush": "avoid the point",
-            "break the ice": "create connection",
-            "hit the nail on the head": "exactly right",
-            "let the cat out of the bag": "reveal the secret",
-        }
-        
-        # Build single regex pattern for all clichés (case-insensitive)
-        # Create a mapping of lowercase clichés to replacements for lookup
-        cliche_lower_map: Dict[str, str] = {cliche.lower(): replacement for cliche, replacement in cliche_replacements.items()}
-        
-        # Combine all cliché patterns into one regex (case-insensitive)
-        # Sort by length (longest first) to avoid partial matches
-        sorted_cliches = sorted(cliche_replacements.keys(), key=len, reverse=True)
-        cliche_pattern = re.compile("|".join(re.escape(cliche) for cliche in sorted_cliches), re.IGNORECASE)
-        
-        def cliche_replacer(match) -> str:
-            # Get the matched text (case-insensitive lookup)
-            matched_text = match.group(0).lower()
-            default = match.group(0)
-            result = cliche_lower_map.get(matched_text, default)
-            return result if result is not None else default
-        
-        revised_text = cliche_pattern.sub(cliche_replacer, revised_text)
-        
-        # Sharpen vague language - combine all replacements into a single regex
-        vague_replacements = {
-            " very ": " ",
-            " really ": " ",
-            " quite ": " ",
-            " somewhat ": " ",
-            " kind of ": " ",
-            " sort of ": " ",
-        }
-        
-        # Build single regex pattern for vague language
-        vague_pattern = re.compile("|".join(re.escape(vague) for vague in vague_replacements.keys()))
-        revised_text = vague_pattern.sub(lambda m: vague_replacements[m.group(0)], revised_text)
-        
-        # Remove redundant phrases - combine into single regex (case-insensitive)
-        # Use a single dictionary from the start to avoid maintaining two data structures
-        # Order matters: longer phrases must be replaced first to avoid partial matches
-        redundant_phrases_map: Dict[str, str] = {
-            "due to the fact that": "because",  # Longest first
-            "the fact that": "that",
-            "in order to": "to",
-        }
-        
-        # Build single regex pattern for all redundant phrases (case-insensitive)
-        # Sort by length (longest first) to ensure longest matches are found first
-        sorted_redundant_phrases = sorted(redundant_phrases_map.keys(), key=len, reverse=True)
-        redundant_pattern = re.compile("|".join(re.escape(phrase) for phrase in sorted_redundant_phrases), re.IGNORECASE)
-        
-        def redundant_replacer(match) -> str:
-            # Get the matched text (case-insensitive lookup)
-            matched_text = match.group(0).lower()
-            default = match.group(0)
-            result = redundant_phrases_map.get(matched_text, default)
-            return result if result is not None else default
-        
-        revised_text = redundant_pattern.sub(redundant_replacer, revised_text)
+        revised_text = _WORD_CHOICE_PATTERN.sub(_replace_word_choice, text)
+        revised_text = _REDUNDANT_PATTERN.sub(_replace_redundant, revised_text)
         
         return revised_text
     
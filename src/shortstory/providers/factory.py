@@ -8,6 +8,7 @@ a default provider instance.
 
 import os
 import logging
+import threading
 from typing import Optional
 
 from .gemini import GeminiProvider, DEFAULT_GEMINI_MODEL
@@ -16,6 +17,7 @@ from ..utils.llm import BaseLLMClient
 logger = logging.getLogger(__name__)
 
 _default_provider: Optional[BaseLLMClient] = None
+_default_provider_lock = threading.Lock()
 
 
 def create_provider(provider_name: Optional[str] = None, **kwargs) -> BaseLLMClient:
@@ -63,16 +65,23 @@ def get_default_provider() -> BaseLLMClient:
     - LLM_MODEL: Model name (default: gemini-2.5-flash)
     - LLM_TEMPERATURE: Temperature (default: 0.7)
     
+    Thread-safe: the provider is created at most once, and the lock is only
+    taken until it exists.
+    
     Returns:
         BaseLLMClient instance
     """
     global _default_provider
     
-    if _default_provider is None:
-        _default_provider = create_provider()
-        logger.info(f"Created default LLM provider: {type(_default_provider).__name__}")
+    provider = _default_provider
+    if provider is not None:
+        return provider
     
-    return _default_provider
+    with _default_provider_lock:
+        if _default_provider is None:
+            _default_provider = create_provider()
+            logger.info(f"Created default LLM provider: {type(_default_provider).__name__}")
+        return _default_provider
 
 
 def reset_default_provider() -> None:
@@ -82,6 +91,7 @@ def reset_default_provider() -> None:
     This is useful for testing or when configuration changes.
     """
     global _default_provider
-    _default_provider = None
+    with _default_provider_lock:
+        _default_provider = None
     logger.info("Reset default LLM provider")
 
@@ -8,15 +8,12 @@ Google's Generative AI models. All Gemini-specific code is isolated here.
 import os
 import logging
 import time
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Iterator, Tuple, TYPE_CHECKING
 
-from ..utils.llm import BaseLLMClient
+from ..utils.llm import BaseLLMClient, _estimate_tokens, _tokens_for_word_count
 from ..utils.llm_constants import (
     GEMINI_MAX_OUTPUT_TOKENS,
     DEFAULT_MIN_TOKENS,
-    TOKENS_PER_WORD_ESTIMATE,
-    TOKEN_BUFFER_MULTIPLIER,
-    TOKEN_BUFFER_ADDITION,
     CHARS_PER_TOKEN_ESTIMATE,
 )
 
@@ -37,10 +34,12 @@ if TYPE_CHECKING:
 
 try:
     import google.generativeai as genai  # type: ignore
+    from google.generativeai.types import GenerationConfig  # type: ignore
     GENAI_AVAILABLE = True
 except ImportError:
     GENAI_AVAILABLE = False
     genai = None  # type: ignore
+    GenerationConfig = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +55,9 @@ FALLBACK_ALLOWED_MODELS: List[str] = [
     "gemini-1.0-pro",
 ]
 
+# Normalized fallback names, built once for O(1) membership checks
+_FALLBACK_MODELS_NORMALIZED = frozenset(m.replace("models/", "") for m in FALLBACK_ALLOWED_MODELS)
+
 DEFAULT_GEMINI_MODEL = "gemini-2.5-flash"
 
 # Model context windows (approximate, in tokens)
@@ -90,17 +92,19 @@ def _validate_gemini_model_name(model_name: str, available_models: Optional[List
     # Use provided available_models or fallback
     if available_models is None:
         available_models = FALLBACK_ALLOWED_MODELS
+        normalized_available = _FALLBACK_MODELS_NORMALIZED
         logger.warning(
             "Using fallback model list. Dynamic model fetching should be used for security. "
             "Fallback models may include deprecated or insecure models."
         )
-    
-    # Normalize available models (remove 'models/' prefix for comparison)
-    normalized_available = [m.replace("models/", "") for m in available_models]
+    else:
+        # Normalize available models (remove 'models/' prefix for comparison)
+        normalized_available = frozenset(m.replace("models/", "") for m in available_models)
     
     if base_name not in normalized_available:
+        allowed = ', '.join(m.replace("models/", "") for m in available_models)
         raise ValueError(
-            f"Invalid Gemini model: {model_name}. Allowed models: {', '.join(normalized_available)}"
+            f"Invalid Gemini model: {model_name}. Allowed models: {allowed}"
         )
     
     # Return with 'models/' prefix
@@ -127,12 +131,10 @@ def _calculate_gemini_max_output_tokens(
     Returns:
         Maximum output tokens to request
     """
-    from ..utils.llm import _estimate_tokens
-    
-    # Estimate prompt tokens
-    prompt_tokens = _estimate_tokens(prompt, model_name)
-    if system_prompt:
-        prompt_tokens += _estimate_tokens(system_prompt, model_name)
+    # Estimate prompt tokens on the same concatenation generate() sends, so the
+    # prompt is tokenized once and later estimates of full_prompt hit the cache
+    combined_prompt = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+    prompt_tokens = _estimate_tokens(combined_prompt, model_name)
     
     # Get model context window
     context_window = GEMINI_CONTEXT_WINDOWS.get(model_name.replace("models/", ""), DEFAULT_GEMINI_CONTEXT_WINDOW)
@@ -142,7 +144,7 @@ def _calculate_gemini_max_output_tokens(
     
     # If target word count is specified, calculate tokens needed
     if target_word_count:
-        tokens_needed = int(target_word_count * TOKENS_PER_WORD_ESTIMATE * TOKEN_BUFFER_MULTIPLIER) + TOKEN_BUFFER_ADDITION
+        tokens_needed = _tokens_for_word_count(target_word_count)
         # Use the minimum of: tokens needed, available tokens, max output tokens
         max_tokens = min(tokens_needed, available_tokens, GEMINI_MAX_OUTPUT_TOKENS)
         max_tokens = max(max_tokens, DEFAULT_MIN_TOKENS)  # Ensure minimum
@@ -154,6 +156,27 @@ def _calculate_gemini_max_output_tokens(
     return max_tokens
 
 
+def _extract_from_candidates(response) -> str:
+    """
+    Collect text from the first response candidate's parts.
+    
+    Used only when response.text is empty or unavailable, e.g. when the
+    SDK refuses to build the text accessor for a multi-part candidate.
+    
+    Args:
+        response: Gemini generate_content response
+        
+    Returns:
+        Concatenated text of the candidate's parts, or an empty string
+    """
+    candidates = getattr(response, 'candidates', None)
+    if not candidates:
+        return ""
+    content = getattr(candidates[0], 'content', None)
+    parts = getattr(content, 'parts', None) or ()
+    return "".join(part.text for part in parts if isinstance(getattr(part, 'text', None), str))
+
+
 class GeminiProvider(BaseLLMClient):
     """
     Provider for interacting with Google Gemini API.
@@ -175,8 +198,8 @@ class GeminiProvider(BaseLLMClient):
     
     Current coupling points:
     - Direct import of `google.generativeai` at module level
-    - Direct use of `self._genai.GenerativeModel()` in `generate()`
-    - Direct import of `google.generativeai.types.GenerationConfig` in `generate()`
+    - Direct use of `self._genai.GenerativeModel()` in the `model` property
+    - Direct import of `google.generativeai.types.GenerationConfig` at module level
     
     This coupling is acceptable for the current use case but limits flexibility
     for future multi-provider support or testing scenarios. Future refactoring could
@@ -240,11 +263,11 @@ class GeminiProvider(BaseLLMClient):
                 if not (m in seen or seen.add(m))
             ]
             
-            logger.info(f"Fetched {len(self.available_models)} available Gemini models dynamically")
+            logger.info("Fetched %d available Gemini models dynamically", len(self.available_models))
         except (ConnectionError, TimeoutError, OSError) as e:
             logger.error(
-                f"Failed to fetch available Gemini models dynamically (network error), using fallback list (security risk): {e}",
-                exc_info=True
+                "Failed to fetch available Gemini models dynamically (network error), using fallback list (security risk): %s",
+                e, exc_info=True
             )
             # Fallback to predefined list if API call fails
             # This is a security risk as deprecated/insecure models may still be in the list
@@ -252,8 +275,8 @@ class GeminiProvider(BaseLLMClient):
         except Exception as e:
             # Catch any other unexpected errors (API errors, etc.)
             logger.error(
-                f"Failed to fetch available Gemini models dynamically (unexpected error), using fallback list (security risk): {e}",
-                exc_info=True
+                "Failed to fetch available Gemini models dynamically (unexpected error), using fallback list (security risk): %s",
+                e, exc_info=True
             )
             # Fallback to predefined list if API call fails
             # This is a security risk as deprecated/insecure models may still be in the list
@@ -261,15 +284,26 @@ class GeminiProvider(BaseLLMClient):
         
         # Validate model name against dynamically fetched list
         self._model_name = _validate_gemini_model_name(model_name, self.available_models)
+        # Unprefixed name, computed once for availability checks and monitoring labels
+        self._base_model_name = self._model_name.replace("models/", "")
         self.temperature = temperature
+        # GenerativeModel is built on first use and reused for every request
+        self._model = None
         
-        logger.info(f"Initialized GeminiProvider with model: {self._model_name}")
+        logger.info("Initialized GeminiProvider with model: %s", self._model_name)
     
     @property
     def model_name(self) -> str:
         """Get the model name being used by this provider."""
         return self._model_name
     
+    @property
+    def model(self):
+        """Get the GenerativeModel for this provider, creating it on first use."""
+        if self._model is None:
+            self._model = self._genai.GenerativeModel(self.model_name)  # type: ignore
+        return self._model
+    
     def generate(
         self,
         prompt: str,
@@ -294,24 +328,12 @@ class GeminiProvider(BaseLLMClient):
         """
         start_time = time.time()
         input_tokens = None
-        output_tokens = None
-        error_type = None
         
         try:
-            model = self._genai.GenerativeModel(self.model_name)  # type: ignore
-            
-            # Build full prompt
-            full_prompt = prompt
-            if system_prompt:
-                full_prompt = f"{system_prompt}\n\n{prompt}"
-            
-            # Calculate max_tokens if not provided
-            if max_tokens is None:
-                max_tokens = _calculate_gemini_max_output_tokens(
-                    prompt=prompt,
-                    system_prompt=system_prompt,
-                    model_name=self.model_name
-                )
+            model = self.model
+            full_prompt, generation_config, max_tokens = self._prepare_request(
+                prompt, system_prompt, temperature, max_tokens
+            )
             
             # Estimate input tokens for monitoring
             try:
@@ -319,153 +341,274 @@ class GeminiProvider(BaseLLMClient):
                 input_tokens = model.count_tokens(full_prompt).total_tokens  # type: ignore
             except (AttributeError, TypeError, ValueError) as e:
                 # Fallback to estimation if count_tokens fails
-                logger.debug(f"Token counting failed, using estimation: {e}")
-                from ..utils.llm import _estimate_tokens
+                logger.debug("Token counting failed, using estimation: %s", e)
                 input_tokens = _estimate_tokens(full_prompt, self.model_name)
             
-            # Configure generation
-            from google.generativeai.types import GenerationConfig  # type: ignore
-            generation_config = GenerationConfig(  # type: ignore
-                temperature=temperature if temperature is not None else self.temperature,
-                max_output_tokens=max_tokens,
-            )
-            
             # Generate content
             response = model.generate_content(  # type: ignore
                 full_prompt,
                 generation_config=generation_config,
             )
+            return self._process_response(response, start_time, input_tokens, max_tokens)
+        except Exception as e:
+            self._record_generate_error(e, start_time, input_tokens)
+            raise
+    
+    async def generate_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Generate text with the SDK's native async API.
+        
+        Behaves like generate(), but awaits generate_content_async so many
+        requests can be in flight on one event loop.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            temperature: Generation temperature (overrides instance default)
+            max_tokens: Maximum output tokens (if None, calculated automatically)
             
-            # Extract usage information if available
-            if hasattr(response, 'usage_metadata'):
-                usage = response.usage_metadata
-                if hasattr(usage, 'prompt_token_count'):
-                    input_tokens = usage.prompt_token_count
-                if hasattr(usage, 'candidates_token_count'):
-                    output_tokens = usage.candidates_token_count
-            elif hasattr(response, 'candidates') and response.candidates:
-                # Try to get token count from candidates
-                candidate = response.candidates[0]
-                if hasattr(candidate, 'token_count'):
-                    output_tokens = candidate.token_count
-            
-            # Estimate output tokens if not available
-            if output_tokens is None and response.text:
-                from ..utils.llm import _estimate_tokens
-                output_tokens = _estimate_tokens(response.text, self.model_name)
-            
-            # Extract text from response
-            if not response.text:
-                finish_reason = 'UNKNOWN'
-                if hasattr(response, 'candidates') and response.candidates:
-                    finish_reason = getattr(response.candidates[0], 'finish_reason', 'UNKNOWN')
-                logger.warning(f"Gemini generation finished with reason: {finish_reason}. No text returned.")
-                
-                # Track API call with error
-                duration = time.time() - start_time
-                if MONITORING_AVAILABLE and track_llm_api_call:
-                    track_llm_api_call(
-                        provider='gemini',
-                        model=self.model_name.replace('models/', ''),
-                        operation='generate',
-                        duration=duration,
-                        status='error',
-                        input_tokens=input_tokens,
-                        output_tokens=0,
-                        error_type='no_text_returned'
-                    )
-                return ""
-            
-            # CRITICAL: Check finish_reason even when text is returned
-            # MAX_TOKENS means the output was truncated and we need to continue
-            finish_reason = 'STOP'  # Default assumption
-            if hasattr(response, 'candidates') and response.candidates:
-                finish_reason = getattr(response.candidates[0], 'finish_reason', 'STOP')
-            
-            text = response.text.strip()
+        Returns:
+            Generated text
             
-            # Log finish_reason for debugging
-            if finish_reason == 'MAX_TOKENS':
-                logger.warning(
-                    f"Gemini generation hit MAX_TOKENS limit ({max_tokens} tokens). "
-                    f"Output may be truncated. Text length: {len(text)} chars, "
-                    f"estimated words: {len(text.split())}"
-                )
-            else:
-                logger.debug(f"Gemini generation finished with reason: {finish_reason}")
+        Raises:
+            Exception: If generation fails
+        """
+        start_time = time.time()
+        input_tokens = None
+        
+        try:
+            model = self.model
+            full_prompt, generation_config, max_tokens = self._prepare_request(
+                prompt, system_prompt, temperature, max_tokens
+            )
             
-            # Track successful API call
-            duration = time.time() - start_time
-            if MONITORING_AVAILABLE and track_llm_api_call:
-                track_llm_api_call(
-                    provider='gemini',
-                    model=self.model_name.replace('models/', ''),
-                    operation='generate',
-                    duration=duration,
-                    status='success',
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens
-                )
+            # Estimate input tokens for monitoring without another network round trip;
+            # usage metadata on the response replaces this when available
+            input_tokens = _estimate_tokens(full_prompt, self.model_name)
             
-            return text
+            response = await model.generate_content_async(  # type: ignore
+                full_prompt,
+                generation_config=generation_config,
+            )
+            return self._process_response(
+                response, start_time, input_tokens, max_tokens, operation='generate_async'
+            )
+        except Exception as e:
+            self._record_generate_error(e, start_time, input_tokens, operation='generate_async')
+            raise
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Stream generated text from Gemini as it is produced.
+        
+        Uses generate_content(stream=True). Closing the generator stops
+        reading the response, so callers can stop as soon as they have
+        enough text.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            temperature: Generation temperature (overrides instance default)
+            max_tokens: Maximum output tokens (if None, calculated automatically)
             
-        except (ConnectionError, TimeoutError, OSError) as e:
-            # Network-related errors
-            duration = time.time() - start_time
-            error_type = type(e).__name__
-            logger.error(f"Network error generating content with Gemini: {e}", exc_info=True)
+        Yields:
+            Chunks of generated text
             
-            # Track API call with error
-            if MONITORING_AVAILABLE and track_llm_api_call:
-                track_llm_api_call(
-                    provider='gemini',
-                    model=self.model_name.replace('models/', ''),
-                    operation='generate',
-                    duration=duration,
-                    status='error',
-                    input_tokens=input_tokens,
-                    output_tokens=None,
-                    error_type=error_type
-                )
-            raise
-        except (ValueError, TypeError, AttributeError) as e:
-            # Configuration or API usage errors
-            duration = time.time() - start_time
-            error_type = type(e).__name__
-            logger.error(f"Configuration error generating content with Gemini: {e}", exc_info=True)
+        Raises:
+            Exception: If generation fails
+        """
+        start_time = time.time()
+        input_tokens = None
+        
+        try:
+            model = self.model
+            full_prompt, generation_config, max_tokens = self._prepare_request(
+                prompt, system_prompt, temperature, max_tokens
+            )
+            input_tokens = _estimate_tokens(full_prompt, self.model_name)
             
-            # Track API call with error
-            if MONITORING_AVAILABLE and track_llm_api_call:
-                track_llm_api_call(
-                    provider='gemini',
-                    model=self.model_name.replace('models/', ''),
-                    operation='generate',
-                    duration=duration,
-                    status='error',
-                    input_tokens=input_tokens,
-                    output_tokens=None,
-                    error_type=error_type
-                )
+            response = model.generate_content(  # type: ignore
+                full_prompt,
+                generation_config=generation_config,
+                stream=True,
+            )
+            for chunk in response:
+                try:
+                    text = chunk.text or ""
+                except (AttributeError, ValueError):
+                    text = _extract_from_candidates(chunk)
+                if text:
+                    yield text
+        except GeneratorExit:
+            # The caller stopped reading early; the request itself succeeded
+            self._track_call('generate_stream', start_time, 'success', input_tokens=input_tokens)
             raise
         except Exception as e:
-            # Catch-all for other API errors (Google API exceptions, etc.)
-            duration = time.time() - start_time
-            error_type = type(e).__name__
-            logger.error(f"Error generating content with Gemini: {e}", exc_info=True)
-            
-            # Track API call with error
-            if MONITORING_AVAILABLE and track_llm_api_call:
-                track_llm_api_call(
-                    provider='gemini',
-                    model=self.model_name.replace('models/', ''),
-                    operation='generate',
-                    duration=duration,
-                    status='error',
-                    input_tokens=input_tokens,
-                    output_tokens=None,
-                    error_type=error_type
-                )
+            self._record_generate_error(e, start_time, input_tokens, operation='generate_stream')
             raise
+        
+        usage = getattr(response, 'usage_metadata', None)
+        self._track_call(
+            'generate_stream', start_time, 'success',
+            input_tokens=getattr(usage, 'prompt_token_count', input_tokens),
+            output_tokens=getattr(usage, 'candidates_token_count', None),
+        )
+    
+    def _prepare_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> Tuple[str, "GenerationConfig", int]:
+        """
+        Build the full prompt and generation config for a request.
+        
+        Returns:
+            Tuple of (full_prompt, generation_config, max_tokens)
+        """
+        # Build full prompt
+        full_prompt = prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\n{prompt}"
+        
+        # Calculate max_tokens if not provided
+        if max_tokens is None:
+            max_tokens = _calculate_gemini_max_output_tokens(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                model_name=self.model_name
+            )
+        
+        # Configure generation
+        generation_config = GenerationConfig(  # type: ignore
+            temperature=temperature if temperature is not None else self.temperature,
+            max_output_tokens=max_tokens,
+        )
+        return full_prompt, generation_config, max_tokens
+    
+    def _process_response(
+        self,
+        response,
+        start_time: float,
+        input_tokens: Optional[int],
+        max_tokens: int,
+        operation: str = 'generate',
+    ) -> str:
+        """
+        Extract text from a generate_content response and record the call.
+        
+        The call is recorded under operation, so blocking and async requests
+        can be told apart in monitoring.
+        
+        Returns:
+            Stripped response text, or an empty string if none was returned
+        """
+        output_tokens = None
+        
+        # Extract text, optimizing for the common case where response.text is set.
+        # response.text raises ValueError when the candidate has no plain text part.
+        try:
+            text = response.text or ""
+        except (AttributeError, ValueError):
+            text = ""
+        if not text:
+            text = _extract_from_candidates(response)
+        
+        candidates = getattr(response, 'candidates', None)
+        
+        # Extract usage information if available
+        usage = getattr(response, 'usage_metadata', None)
+        if usage is not None:
+            input_tokens = getattr(usage, 'prompt_token_count', input_tokens)
+            output_tokens = getattr(usage, 'candidates_token_count', None)
+        elif candidates:
+            # Try to get token count from candidates
+            output_tokens = getattr(candidates[0], 'token_count', None)
+        
+        # Estimate output tokens if not available
+        if output_tokens is None and text:
+            output_tokens = _estimate_tokens(text, self.model_name)
+        
+        if not text:
+            finish_reason = getattr(candidates[0], 'finish_reason', 'UNKNOWN') if candidates else 'UNKNOWN'
+            logger.warning("Gemini generation finished with reason: %s. No text returned.", finish_reason)
+            
+            self._track_call(
+                operation, start_time, 'error',
+                input_tokens=input_tokens, output_tokens=0, error_type='no_text_returned'
+            )
+            return ""
+        
+        # CRITICAL: Check finish_reason even when text is returned
+        # MAX_TOKENS means the output was truncated and we need to continue
+        finish_reason = getattr(candidates[0], 'finish_reason', 'STOP') if candidates else 'STOP'
+        
+        text = text.strip()
+        
+        # Log finish_reason for debugging
+        if finish_reason == 'MAX_TOKENS':
+            logger.warning(
+                "Gemini generation hit MAX_TOKENS limit (%d tokens). "
+                "Output may be truncated. Text length: %d chars, estimated words: %d",
+                max_tokens, len(text), text.count(' ') + 1,
+            )
+        else:
+            logger.debug("Gemini generation finished with reason: %s", finish_reason)
+        
+        self._track_call(
+            operation, start_time, 'success',
+            input_tokens=input_tokens, output_tokens=output_tokens
+        )
+        
+        return text
+    
+    def _record_generate_error(
+        self,
+        error: Exception,
+        start_time: float,
+        input_tokens: Optional[int],
+        operation: str = 'generate',
+    ) -> None:
+        """Log a failed generate request and record it with monitoring under operation."""
+        if isinstance(error, (ConnectionError, TimeoutError, OSError)):
+            # Network-related errors
+            logger.error("Network error generating content with Gemini: %s", error, exc_info=True)
+        elif isinstance(error, (ValueError, TypeError, AttributeError)):
+            # Configuration or API usage errors
+            logger.error("Configuration error generating content with Gemini: %s", error, exc_info=True)
+        else:
+            # Other API errors (Google API exceptions, etc.)
+            logger.error("Error generating content with Gemini: %s", error, exc_info=True)
+        
+        self._track_call(
+            operation, start_time, 'error',
+            input_tokens=input_tokens, output_tokens=None, error_type=type(error).__name__
+        )
+    
+    def _track_call(self, operation: str, start_time: float, status: str, **fields) -> None:
+        """Record an API call with the monitoring module when it is available."""
+        if MONITORING_AVAILABLE and track_llm_api_call:
+            track_llm_api_call(
+                provider='gemini',
+                model=self._base_model_name,
+                operation=operation,
+                duration=time.time() - start_time,
+                status=status,
+                **fields
+            )
     
     def check_availability(self) -> bool:
         """
@@ -477,61 +620,22 @@ class GeminiProvider(BaseLLMClient):
         start_time = time.time()
         try:
             # Check if configured model is in available models list
-            base_model = self.model_name.replace("models/", "")
-            is_available = base_model in self.available_models
+            is_available = self._base_model_name in self.available_models
             
             if not is_available:
                 logger.warning(
-                    f"Configured Gemini model '{self.model_name}' not found in available models: {self.available_models}"
-                )
-            
-            # Track API call
-            duration = time.time() - start_time
-            if MONITORING_AVAILABLE and track_llm_api_call:
-                track_llm_api_call(
-                    provider='gemini',
-                    model=self.model_name.replace('models/', ''),
-                    operation='check_availability',
-                    duration=duration,
-                    status='success' if is_available else 'error',
-                    error_type=None if is_available else 'model_not_available'
+                    "Configured Gemini model '%s' not found in available models: %s",
+                    self.model_name, self.available_models,
                 )
             
+            self._track_call(
+                'check_availability', start_time, 'success' if is_available else 'error',
+                error_type=None if is_available else 'model_not_available'
+            )
             return is_available
-        except (AttributeError, KeyError, TypeError) as e:
-            # Configuration or data structure errors
-            duration = time.time() - start_time
-            error_type = type(e).__name__
-            logger.error(f"Configuration error checking Gemini API availability: {e}", exc_info=True)
-            
-            # Track API call with error
-            if MONITORING_AVAILABLE and track_llm_api_call:
-                track_llm_api_call(
-                    provider='gemini',
-                    model=self.model_name.replace('models/', ''),
-                    operation='check_availability',
-                    duration=duration,
-                    status='error',
-                    error_type=error_type
-                )
-            
-            return False
         except Exception as e:
-            # Catch-all for other errors
-            duration = time.time() - start_time
-            error_type = type(e).__name__
-            logger.error(f"Error checking Gemini API availability: {e}", exc_info=True)
-            
-            # Track API call with error
-            if MONITORING_AVAILABLE and track_llm_api_call:
-                track_llm_api_call(
-                    provider='gemini',
-                    model=self.model_name.replace('models/', ''),
-                    operation='check_availability',
-                    duration=duration,
-                    status='error',
-                    error_type=error_type
-                )
-            
+            # Configuration or data structure errors are reported separately from other failures
+            kind = "Configuration error" if isinstance(e, (AttributeError, KeyError, TypeError)) else "Error"
+            logger.error("%s checking Gemini API availability: %s", kind, e, exc_info=True)
+            self._track_call('check_availability', start_time, 'error', error_type=type(e).__name__)
             return False
-
@@ -4,20 +4,48 @@ Error handling utilities for the Short Story Pipeline.
 Provides structured error responses and custom exception classes.
 """
 
+import json
 import logging
 import traceback
-from typing import Optional, Dict, Any, TYPE_CHECKING
-from flask import jsonify
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple, TYPE_CHECKING
+from flask import Response, jsonify
+
+# Fast JSON serialization for error responses (optional)
+try:
+    import orjson  # type: ignore
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+# JSON parser for upstream error bodies (orjson errors subclass json.JSONDecodeError)
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 if TYPE_CHECKING:
     from flask import Request
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of frames rendered in debug tracebacks
+TRACEBACK_FRAME_LIMIT = 20
+
+# Shared read-only details for errors raised without any
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+# Mimetype for error responses serialized with orjson
+_JSON_MIMETYPE = "application/json"
+
+# Base message for RateLimitError
+_RATE_LIMIT_MESSAGE = "Rate limit exceeded. Please try again later."
+
 
 class APIError(Exception):
     """Base exception for API errors."""
     
+    # Fixed attribute layout; subclasses declare empty slots to keep it
+    __slots__ = ("message", "error_code", "status_code", "details")
+    
     def __init__(
         self,
         message: str,
@@ -38,12 +66,29 @@ class APIError(Exception):
         self.message = message
         self.error_code = error_code
         self.status_code = status_code
-        self.details = details or {}
+        self.details = details if details else _EMPTY_DETAILS
+    
+    def to_response_payload(self) -> Tuple[Dict[str, Any], int]:
+        """
+        Build the JSON payload and HTTP status for this error.
+        
+        Returns:
+            Tuple of (payload dict, status_code)
+        """
+        payload = {
+            "error": self.message,
+            "error_code": self.error_code,
+        }
+        if self.details:
+            payload["details"] = self.details
+        return payload, self.status_code
 
 
 class ValidationError(APIError):
     """Raised when input validation fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
@@ -56,6 +101,8 @@ class ValidationError(APIError):
 class NotFoundError(APIError):
     """Raised when a resource is not found."""
     
+    __slots__ = ()
+    
     def __init__(self, resource_type: str, resource_id: str):
         super().__init__(
             message=f"{resource_type} with ID '{resource_id}' not found.",
@@ -68,24 +115,31 @@ class NotFoundError(APIError):
 class RateLimitError(APIError):
     """Raised when rate limit is exceeded."""
     
+    __slots__ = ()
+    
     def __init__(self, retry_after: Optional[int] = None):
-        message = "Rate limit exceeded. Please try again later."
-        details = {}
-        if retry_after:
-            details["retry_after"] = retry_after
-            message += f" Retry after {retry_after} seconds."
+        # Common case: raised by the 429 handler without a retry hint
+        if not retry_after:
+            super().__init__(
+                message=_RATE_LIMIT_MESSAGE,
+                error_code="RATE_LIMIT_EXCEEDED",
+                status_code=429,
+            )
+            return
         
         super().__init__(
-            message=message,
+            message=f"{_RATE_LIMIT_MESSAGE} Retry after {retry_after} seconds.",
             error_code="RATE_LIMIT_EXCEEDED",
             status_code=429,
-            details=details
+            details={"retry_after": retry_after}
         )
 
 
 class ServiceUnavailableError(APIError):
     """Raised when an external service is unavailable."""
     
+    __slots__ = ()
+    
     def __init__(self, service: str, message: Optional[str] = None):
         error_message = message or f"Service '{service}' is currently unavailable."
         super().__init__(
@@ -99,6 +153,8 @@ class ServiceUnavailableError(APIError):
 class MissingDependencyError(APIError):
     """Raised when a required dependency/library is not installed."""
     
+    __slots__ = ()
+    
     def __init__(self, dependency: str, install_command: str):
         message = f"Export requires '{dependency}'. Install with: {install_command}"
         super().__init__(
@@ -112,10 +168,17 @@ class MissingDependencyError(APIError):
 class StorageError(APIError):
     """Base exception for storage-related errors."""
     
-    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+    __slots__ = ()
+    
+    def __init__(
+        self,
+        message: str,
+        details: Optional[Dict[str, Any]] = None,
+        error_code: str = "STORAGE_ERROR"
+    ):
         super().__init__(
             message=message,
-            error_code="STORAGE_ERROR",
+            error_code=error_code,
             status_code=500,
             details=details
         )
@@ -124,17 +187,19 @@ class StorageError(APIError):
 class DataIntegrityError(StorageError):
     """Raised when data integrity constraints are violated."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(message, details)
-        self.error_code = "DATA_INTEGRITY_ERROR"
+        super().__init__(message, details, error_code="DATA_INTEGRITY_ERROR")
 
 
 class DatabaseConnectionError(StorageError):
     """Raised when database connection or operational errors occur."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
-        super().__init__(message, details)
-        self.error_code = "DATABASE_CONNECTION_ERROR"
+        super().__init__(message, details, error_code="DATABASE_CONNECTION_ERROR")
 
 
 def parse_error_response(response_text: str, status_code: int) -> Dict[str, Any]:
@@ -156,8 +221,6 @@ def parse_error_response(response_text: str, status_code: int) -> Dict[str, Any]
             "raw_text": str (if JSON parsing failed)
         }
     """
-    import json
-    
     error_info = {
         "error": f"API request failed with status {status_code}",
         "error_code": f"HTTP_{status_code}",
@@ -170,15 +233,19 @@ def parse_error_response(response_text: str, status_code: int) -> Dict[str, Any]
     
     # Try to parse as JSON first
     try:
-        error_data = json.loads(response_text)
+        error_data = _json_loads(response_text)
         if isinstance(error_data, dict):
             # Extract standard error fields
-            error_info["error"] = error_data.get("error", error_info["error"])
-            error_info["error_code"] = error_data.get("error_code", error_info["error_code"])
+            has_error = "error" in error_data
+            has_error_code = "error_code" in error_data
+            if has_error:
+                error_info["error"] = error_data["error"]
+            if has_error_code:
+                error_info["error_code"] = error_data["error_code"]
             if "details" in error_data:
                 error_info["details"] = error_data["details"]
             # Include full response if it's an error object
-            if "error" in error_data or "error_code" in error_data:
+            if has_error or has_error_code:
                 error_info["full_response"] = error_data
     except (json.JSONDecodeError, ValueError):
         # Not JSON, use text directly
@@ -189,116 +256,217 @@ def parse_error_response(response_text: str, status_code: int) -> Dict[str, Any]
     return error_info
 
 
-def create_error_response(
-    error: Exception,
-    include_traceback: bool = False,
-    request_context: Optional['Request'] = None
-) -> tuple:
+def _format_traceback(error: BaseException, limit: int = TRACEBACK_FRAME_LIMIT) -> str:
     """
-    Create a standardized error response.
+    Format an exception traceback with a bounded frame depth.
     
     Args:
-        error: Exception instance
-        include_traceback: Whether to include traceback in response (for debugging)
-        request_context: Optional Flask request object for logging context
+        error: Exception to format
+        limit: Maximum number of frames to render
+        
+    Returns:
+        Formatted traceback string
+    """
+    return "".join(
+        traceback.TracebackException.from_exception(
+            error, limit=limit, capture_locals=False
+        ).format()
+    )
+
+
+def _json_response(payload: Dict[str, Any], status_code: int) -> tuple:
+    """
+    Serialize an error payload into a JSON response.
+    
+    Uses orjson directly when available, which skips jsonify's app-context
+    lookups. Falls back to jsonify if orjson is missing or cannot encode
+    the payload.
+    
+    Args:
+        payload: Response payload
+        status_code: HTTP status code
     
     Returns:
-        Tuple of (json_response, status_code)
+        Tuple of (response, status_code)
     """
+    if ORJSON_AVAILABLE:
+        try:
+            body = orjson.dumps(
+                payload,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
+            return Response(body, mimetype=_JSON_MIMETYPE), status_code
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return jsonify(payload), status_code
+
+
+def _log_error(error: Exception, request_context: Optional['Request'] = None) -> None:
+    """
+    Log an error with request context.
+    
+    Args:
+        error: Exception instance
+        request_context: Optional Flask request object for logging context
+    """
+    # Skip message formatting and exc_info capture when ERROR is filtered out
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    
     # Extract request info if available
     request_path = request_context.path if request_context else None
     request_method = request_context.method if request_context else None
     
-    # Log the error
     logger.error(
-        f"Error: {type(error).__name__}: {str(error)}",
-        exc_info=True,
+        "Error: %s: %s",
+        type(error).__name__,
+        error,
+        exc_info=error,
         extra={
             "path": request_path,
             "method": request_method,
         }
     )
+
+
+def _create_error_response_debug(
+    error: Exception,
+    request_context: Optional['Request'] = None
+) -> tuple:
+    """
+    Create an error response for debug mode.
     
-    # Handle APIError instances
-    if isinstance(error, APIError):
-        response = {
-            "error": error.message,
-            "error_code": error.error_code,
-        }
-        if error.details:
-            response["details"] = error.details
-        if include_traceback:
-            response["traceback"] = traceback.format_exc()
+    Exposes the real error message and always includes a traceback.
+    
+    Args:
+        error: Exception instance
+        request_context: Optional Flask request object for logging context
+    
+    Returns:
+        Tuple of (json_response, status_code)
+    """
+    _log_error(error, request_context)
+    
+    # APIError instances build their own payload
+    to_payload = getattr(error, "to_response_payload", None)
+    if to_payload is not None:
+        response, status_code = to_payload()
+        response["traceback"] = _format_traceback(error)
         
-        return jsonify(response), error.status_code
+        return _json_response(response, status_code)
     
     # Handle other exceptions
-    error_message = str(error)
-    error_type = type(error).__name__
+    response = {
+        "error": str(error),
+        "error_code": "INTERNAL_ERROR",
+        "error_type": type(error).__name__,
+        "traceback": _format_traceback(error),
+    }
     
-    # Don't expose internal errors in production
-    if not include_traceback:
-        error_message = "An unexpected error occurred. Please try again or contact support if the issue persists."
+    return _json_response(response, 500)
+
+
+def _create_error_response_prod(
+    error: Exception,
+    request_context: Optional['Request'] = None
+) -> tuple:
+    """
+    Create an error response for production mode.
+    
+    Hides internal error messages and never includes a traceback.
     
+    Args:
+        error: Exception instance
+        request_context: Optional Flask request object for logging context
+    
+    Returns:
+        Tuple of (json_response, status_code)
+    """
+    _log_error(error, request_context)
+    
+    # APIError instances build their own payload
+    to_payload = getattr(error, "to_response_payload", None)
+    if to_payload is not None:
+        response, status_code = to_payload()
+        
+        return _json_response(response, status_code)
+    
+    # Don't expose internal errors in production
     response = {
-        "error": error_message,
+        "error": "An unexpected error occurred. Please try again or contact support if the issue persists.",
         "error_code": "INTERNAL_ERROR",
-        "error_type": error_type,
+        "error_type": type(error).__name__,
     }
     
-    if include_traceback:
-        response["traceback"] = traceback.format_exc()
+    return _json_response(response, 500)
+
+
+def create_error_response(
+    error: Exception,
+    include_traceback: bool = False,
+    request_context: Optional['Request'] = None
+) -> tuple:
+    """
+    Create a standardized error response.
     
-    return jsonify(response), 500
+    Args:
+        error: Exception instance
+        include_traceback: Whether to include traceback in response (for debugging)
+        request_context: Optional Flask request object for logging context
+    
+    Returns:
+        Tuple of (json_response, status_code)
+    """
+    if include_traceback:
+        return _create_error_response_debug(error, request_context)
+    return _create_error_response_prod(error, request_context)
 
 
 def register_error_handlers(app, debug: bool = False):
     """
     Register error handlers for the Flask app.
     
+    The debug flag is fixed at registration time, so the matching response
+    builder is selected once here rather than on every error.
+    
     Args:
         app: Flask application instance
         debug: Whether to include tracebacks in error responses
     """
     from flask import request  # Import here to avoid circular dependency
     
+    create_resp = _create_error_response_debug if debug else _create_error_response_prod
+    
     @app.errorhandler(APIError)
     def handle_api_error(error: APIError):
         """Handle APIError exceptions."""
-        return create_error_response(error, include_traceback=debug, request_context=request)
+        return create_resp(error, request)
     
     @app.errorhandler(404)
     def handle_not_found(error):
         """Handle 404 errors."""
-        return create_error_response(
-            NotFoundError("Resource", request.path),
-            include_traceback=debug,
-            request_context=request
-        )
+        return create_resp(NotFoundError("Resource", request.path), request)
     
     @app.errorhandler(405)
     def handle_method_not_allowed(error):
         """Handle 405 Method Not Allowed errors."""
-        return jsonify({
+        return _json_response({
             "error": f"Method '{request.method}' not allowed for this endpoint.",
             "error_code": "METHOD_NOT_ALLOWED",
-        }), 405
+        }, 405)
     
     @app.errorhandler(429)
     def handle_rate_limit(error):
         """Handle 429 Rate Limit errors."""
-        return create_error_response(
-            RateLimitError(),
-            include_traceback=debug,
-            request_context=request
-        )
+        return create_resp(RateLimitError(), request)
     
     @app.errorhandler(500)
     def handle_internal_error(error):
         """Handle 500 Internal Server errors."""
-        return create_error_response(error, include_traceback=debug, request_context=request)
+        return create_resp(error, request)
     
     @app.errorhandler(Exception)
     def handle_generic_exception(error: Exception):
         """Handle all other exceptions."""
-        return create_error_response(error, include_traceback=debug, request_context=request)
+        return create_resp(error, request)
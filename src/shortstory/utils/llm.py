@@ -6,21 +6,49 @@ utilities for story generation. Concrete provider implementations are in
 the providers package (e.g., providers.gemini.GeminiProvider).
 """
 
+import os
 import re
+import json
+import time
+import asyncio
+import hashlib
 import logging
+import functools
+import threading
+import unicodedata
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Any, Iterator, Tuple, TYPE_CHECKING
 
 from .llm_constants import (
     STORY_DEFAULT_MAX_WORDS,
+    STORY_MIN_WORDS,
     DEFAULT_MIN_TOKENS,
     TOKENS_PER_WORD_ESTIMATE,
     TOKEN_BUFFER_MULTIPLIER,
     TOKEN_BUFFER_ADDITION,
     CHARS_PER_TOKEN_ESTIMATE,
+    SHORT_TEXT_MAX_CHARS,
     TARGET_WORD_COUNT_RATIO,
+    NEAR_TARGET_WORD_COUNT_RATIO,
     GEMINI_MAX_OUTPUT_TOKENS,
     MIN_TOKENS_FOR_FULL_STORY,
+    BATCH_GENERATE_MAX_WORKERS,
+    BATCH_RETRY_ATTEMPTS,
+    BATCH_RETRY_BASE_DELAY,
+    BATCH_RATE_LIMIT_MIN_DELAY,
+)
+from .story_prompt_builder import (
+    StoryParams,
+    Tone,
+    Pace,
+    build_story_system_prompt,
+    build_story_user_prompt,
+    build_revision_system_prompt,
+    build_revision_user_prompt,
+    normalize_constraints,
 )
 
 # Lazy imports for backward compatibility (avoid circular imports)
@@ -31,6 +59,117 @@ if TYPE_CHECKING:
 # Initialize logger at module level
 logger = logging.getLogger(__name__)
 
+# Optional tiktoken support for accurate token counting
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    tiktoken = None
+    TIKTOKEN_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    Load a tiktoken encoding on first use and reuse it afterwards.
+    
+    Prefers cl100k_base and falls back to p50k_base. Loading is deferred until
+    a token count is actually needed, because tiktoken may have to download the
+    BPE files on a clean cache and importing this module must stay cheap.
+    Returns None when tiktoken is not installed or no encoding can be loaded,
+    in which case token counts use the character-based estimate.
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    for encoding_name in ("cl100k_base", "p50k_base"):
+        try:
+            return tiktoken.get_encoding(encoding_name)
+        except Exception as e:
+            logger.debug("Could not load tiktoken encoding %s: %s", encoding_name, e)
+    return None
+
+
+def _create_rate_limiter():
+    """
+    Create the limiter shared by all batch requests in this process.
+    
+    LLM_RATE_LIMIT caps how many requests may be in flight at once across
+    every batch_generate call. When unset (or not a positive integer), only
+    the per-batch worker count limits concurrency.
+    """
+    try:
+        limit = int(os.getenv("LLM_RATE_LIMIT", "0"))
+    except ValueError:
+        logger.warning("Ignoring invalid LLM_RATE_LIMIT value: %r", os.getenv("LLM_RATE_LIMIT"))
+        limit = 0
+    return threading.BoundedSemaphore(limit) if limit > 0 else nullcontext()
+
+
+_rate_limiter = _create_rate_limiter()
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an exception from a provider represents an HTTP 429 response."""
+    message = str(error)
+    return "429" in message or "resource has been exhausted" in message.lower()
+
+
+def _read_response_cache_size() -> int:
+    """
+    Read the revision response cache size from LLM_RESPONSE_CACHE_SIZE.
+    
+    The cache is opt-in: when unset (or not a positive integer) every request
+    goes to the provider. Only revisions are cached; drafts are sampled and a
+    repeated draft request is expected to produce a fresh story.
+    """
+    try:
+        size = int(os.getenv("LLM_RESPONSE_CACHE_SIZE", "0"))
+    except ValueError:
+        logger.warning(
+            "Ignoring invalid LLM_RESPONSE_CACHE_SIZE value: %r", os.getenv("LLM_RESPONSE_CACHE_SIZE")
+        )
+        size = 0
+    return max(size, 0)
+
+
+_response_cache_size = _read_response_cache_size()
+_response_cache: "OrderedDict[str, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(operation: str, model_name: str, *inputs: Any) -> str:
+    """
+    Build an exact-match cache key from canonical JSON of the request inputs.
+    
+    Callers check _response_cache_size first so nothing is serialized or
+    hashed while the cache is disabled.
+    """
+    payload = json.dumps([operation, model_name, *inputs], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _get_cached_response(key: Optional[str]) -> Optional[str]:
+    """Return a cached response for key and mark it recently used, if present."""
+    if key is None:
+        return None
+    with _response_cache_lock:
+        text = _response_cache.get(key)
+        if text is not None:
+            _response_cache.move_to_end(key)
+        return text
+
+
+def _store_cached_response(key: Optional[str], text: str) -> None:
+    """Store a finished response, evicting the least recently used entry when full."""
+    if key is None or not text:
+        return
+    with _response_cache_lock:
+        _response_cache[key] = text
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _response_cache_size:
+            _response_cache.popitem(last=False)
+
+
 # Note: DEFAULT_MODEL is now provided via __getattr__ for backward compatibility
 # It returns the Gemini default model. For provider-agnostic code, don't rely on this constant.
 
@@ -88,14 +227,167 @@ class BaseLLMClient(ABC):
             True if API is available, False otherwise
         """
         pass
+    
+    async def generate_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Generate text without blocking the event loop.
+        
+        The default implementation runs generate() in a worker thread.
+        Providers with a native async API should override this.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            temperature: Generation temperature
+            max_tokens: Maximum output tokens
+            
+        Returns:
+            Generated text
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Generate text as a stream of chunks.
+        
+        The default implementation yields the full result of generate() as a
+        single chunk. Providers with a streaming API should override this so
+        callers can process text as it arrives and stop reading early.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            temperature: Generation temperature
+            max_tokens: Maximum output tokens
+            
+        Yields:
+            Chunks of generated text
+        """
+        text = self.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        if text:
+            yield text
+    
+    def batch_generate(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        max_workers: int = BATCH_GENERATE_MAX_WORKERS,
+    ) -> List[str]:
+        """
+        Generate text for several prompts concurrently.
+        
+        Requests are fanned out over a thread pool, since each call spends
+        almost all of its time waiting on the network. Every request goes
+        through the shared LLM_RATE_LIMIT limiter and is retried with
+        exponential backoff on transient failures.
+        
+        Args:
+            prompts: User prompts to generate text for
+            system_prompt: Optional system prompt shared by all requests
+            temperature: Generation temperature
+            max_tokens: Maximum output tokens per request
+            max_workers: Maximum number of concurrent worker threads
+            
+        Returns:
+            Generated texts, in the same order as prompts
+            
+        Raises:
+            Exception: The first error from a request that failed after all retries
+        """
+        if not prompts:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as executor:
+            futures = [
+                executor.submit(
+                    self._generate_with_retry, prompt, system_prompt, temperature, max_tokens
+                )
+                for prompt in prompts
+            ]
+            return [future.result() for future in futures]
+    
+    def _generate_with_retry(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> str:
+        """
+        Call generate() under the shared rate limiter, retrying transient errors.
+        
+        Configuration errors (ValueError, TypeError) are raised immediately.
+        Rate limit responses wait at least BATCH_RATE_LIMIT_MIN_DELAY seconds.
+        """
+        for attempt in range(BATCH_RETRY_ATTEMPTS):
+            try:
+                with _rate_limiter:
+                    return self.generate(
+                        prompt=prompt,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+            except (ValueError, TypeError):
+                raise
+            except Exception as e:
+                if attempt == BATCH_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = BATCH_RETRY_BASE_DELAY * (2 ** attempt)
+                if _is_rate_limit_error(e):
+                    delay = max(delay, BATCH_RATE_LIMIT_MIN_DELAY)
+                logger.warning(
+                    "Batch generation attempt %d/%d failed (%s: %s); retrying in %.1fs",
+                    attempt + 1, BATCH_RETRY_ATTEMPTS, type(e).__name__, e, delay,
+                )
+                time.sleep(delay)
+
+
+@functools.lru_cache(maxsize=512)
+def _encoded_len(text: str, encoding_name: str) -> int:
+    """
+    Count tokens for text with the shared tiktoken encoding.
+    
+    Cached so that repeated inputs (such as the shared system prompt) are only
+    encoded once. The encoding name is part of the key so results from
+    different encodings never mix. Special-token text such as "<|endoftext|>"
+    in user input is counted as ordinary text instead of raising.
+    """
+    return len(_get_encoding().encode(text, disallowed_special=()))
 
 
 def _estimate_tokens(text: str, model_name: str = "default") -> int:
     """
-    Estimate token count for a text string using character-based estimation.
+    Estimate token count for a text string.
     
-    This is a provider-agnostic estimation method. For accurate token counting,
-    it is recommended to use the LLM provider's native token counting method
+    Uses the tiktoken encoding (loaded on first use) when available, and
+    falls back to character-based estimation otherwise. For exact counts,
+    use the LLM provider's native token counting method
     (e.g., model.count_tokens() for Gemini).
     
     Args:
@@ -108,6 +400,17 @@ def _estimate_tokens(text: str, model_name: str = "default") -> int:
     if not text:
         return 0
     
+    # Short labels and names are not worth a tokenizer call; ~3 chars per
+    # token overestimates slightly, which is the safe direction
+    text_length = len(text)
+    if text_length <= SHORT_TEXT_MAX_CHARS:
+        return max(1, text_length // 3) + TOKEN_BUFFER_ADDITION
+    
+    encoding = _get_encoding() if TIKTOKEN_AVAILABLE else None
+    if encoding is not None:
+        token_count = _encoded_len(text, encoding.name)
+        return int(token_count * TOKEN_BUFFER_MULTIPLIER) + TOKEN_BUFFER_ADDITION
+    
     # Character-based estimation (more consistent than mixed approach)
     # Rough estimate: 1 token ≈ 4 characters for English text
     estimated_tokens = len(text) / CHARS_PER_TOKEN_ESTIMATE
@@ -116,7 +419,80 @@ def _estimate_tokens(text: str, model_name: str = "default") -> int:
     return int(estimated_tokens * TOKEN_BUFFER_MULTIPLIER) + TOKEN_BUFFER_ADDITION
 
 
-def _is_story_complete_enough(story_text: str, min_words: int, target_words: int) -> bool:
+def _tokens_for_word_count(word_count: int) -> int:
+    """
+    Estimate the tokens needed to generate a given number of words.
+    
+    Closed-form conversion using TOKENS_PER_WORD_ESTIMATE plus the standard
+    buffer, so no sample text has to be built and tokenized.
+    
+    Args:
+        word_count: Target number of words
+        
+    Returns:
+        Estimated token count
+    """
+    return int(word_count * TOKENS_PER_WORD_ESTIMATE * TOKEN_BUFFER_MULTIPLIER) + TOKEN_BUFFER_ADDITION
+
+
+# Characters that mark a properly finished sentence or closing dialogue.
+# The em dash covers dialogue or narration that ends on a deliberate break.
+_SENTENCE_TERMINALS = frozenset('.!?"\'”’…)—')
+
+# Unicode categories for closing brackets (Pe) and closing quotes (Pf), which
+# also end a sentence when they follow its punctuation
+_CLOSING_PUNCTUATION_CATEGORIES = frozenset(('Pe', 'Pf'))
+
+# Looser set of characters accepted as the end of a complete thought
+_CLOSURE_CHARACTERS = _SENTENCE_TERMINALS | frozenset(',;:-')
+
+
+def _ends_with_terminal(text: str, terminals: frozenset = _SENTENCE_TERMINALS) -> bool:
+    """
+    Check whether the last non-whitespace character of text is in terminals.
+    
+    Scans backwards from the end instead of calling rstrip(), so no copy of
+    the (potentially multi-KB) story is made. Any closing bracket or closing
+    quote is accepted as well, so stories ending in e.g. » or ] are not
+    mistaken for truncated ones.
+    
+    Args:
+        text: Text to check
+        terminals: Set of accepted final characters
+        
+    Returns:
+        True if text ends with one of the terminals, ignoring trailing whitespace
+    """
+    i = len(text) - 1
+    while i >= 0 and text[i].isspace():
+        i -= 1
+    if i < 0:
+        return False
+    last = text[i]
+    return last in terminals or unicodedata.category(last) in _CLOSING_PUNCTUATION_CATEGORIES
+
+
+def _count_words(text: Optional[str]) -> int:
+    """Count whitespace-separated words, treating None and empty text as 0."""
+    return len(text.split()) if text else 0
+
+
+def _last_words(text: str, count: int) -> str:
+    """
+    Return the last count words of text joined by single spaces.
+    
+    rsplit with maxsplit only splits off the tail, so the rest of a long
+    story is not broken into a list of words just to take its end.
+    """
+    return " ".join(text.rsplit(None, count)[-count:])
+
+
+def _is_story_complete_enough(
+    story_text: str,
+    min_words: int,
+    target_words: int,
+    word_count: Optional[int] = None,
+) -> bool:
     """
     Checks if the story is sufficiently long and appears to have a complete thought.
     
@@ -127,6 +503,7 @@ def _is_story_complete_enough(story_text: str, min_words: int, target_words: int
         story_text: Story text to check
         min_words: Minimum word count required
         target_words: Target word count
+        word_count: Word count of story_text, if the caller already knows it
         
     Returns:
         True if story is complete enough, False otherwise
@@ -134,14 +511,12 @@ def _is_story_complete_enough(story_text: str, min_words: int, target_words: int
     if not story_text:
         return False
 
-    word_count = len(story_text.split())
-    stripped = story_text.rstrip()
+    if word_count is None:
+        word_count = _count_words(story_text)
     
     # CRITICAL: If below minimum word count, it's definitely incomplete
     if word_count < min_words:
-        logger.debug(
-            f"Story incomplete: {word_count} words < {min_words} minimum"
-        )
+        logger.debug("Story incomplete: %d words < %d minimum", word_count, min_words)
         return False
 
     # Primary check: If it meets minimum word count, it's complete enough
@@ -149,23 +524,41 @@ def _is_story_complete_enough(story_text: str, min_words: int, target_words: int
     if word_count >= min_words:
         # Check if it ends with a complete thought (any reasonable ending)
         # Accept endings with punctuation, dialogue, or even without if word count is met
-        ends_with_any_closure = stripped.endswith(('.', '!', '?', '"', "'", ',', ';', ':', '-', '—'))
+        ends_with_any_closure = _ends_with_terminal(story_text, _CLOSURE_CHARACTERS)
         
         if ends_with_any_closure:
-            logger.debug(f"Story complete: {word_count} words >= {min_words} minimum, ends with closure")
+            logger.debug("Story complete: %d words >= %d minimum, ends with closure", word_count, min_words)
             return True
         else:
             # Even without punctuation, if word count is met, consider it complete
             # The story might end with a complete thought without ending punctuation
+            # Strip only a bounded tail for the excerpt, not the whole story
             logger.info(
-                f"Story meets word count ({word_count} >= {min_words}) without ending punctuation. "
-                f"Accepting as complete thought. Last 30 chars: '{stripped[-30:]}'"
+                "Story meets word count (%d >= %d) without ending punctuation. "
+                "Accepting as complete thought. Last 30 chars: %r",
+                word_count, min_words, story_text[-200:].rstrip()[-30:],
             )
             return True
     
     return False
 
 
+# Continuation system prompts are static so every continuation request shares
+# a byte-identical prefix that provider-side prompt caching can reuse. The
+# per-call word counts live in the user prompt instead.
+_CONCLUSION_SYSTEM_PROMPT = (
+    "Write a satisfying conclusion to this story. Make it feel complete, resolved, "
+    "and emotionally satisfying. Write at least 200-400 words."
+)
+_CONTINUATION_SYSTEM_PROMPT = (
+    "You are completing a short story. Continue writing until the story is FULLY COMPLETE "
+    "and reaches the minimum word count stated in the request. Include substantial dialogue "
+    "between characters - use conversations to develop plot, reveal character, and create "
+    "emotional depth. The story must end with a complete scene, preferably ending with "
+    "dialogue or a narrative conclusion."
+)
+
+
 def _continue_story_if_needed(
     story_text: str,
     story_min_words: int,
@@ -189,14 +582,18 @@ def _continue_story_if_needed(
         Extended story text
     """
     current_story = story_text
-    initial_word_count = len(current_story.split()) if current_story else 0
+    # Continuations are appended with a single space, so the word count can be
+    # kept up to date by adding each continuation's count instead of re-splitting
+    word_count = _count_words(current_story)
     
     # First, try to add a conclusion if it's long enough but just needs an ending
-    if initial_word_count >= story_min_words and not _is_story_complete_enough(current_story, story_min_words, target_word_count):
-        logger.warning(f"Story has {initial_word_count} words but doesn't feel complete. Adding conclusion...")
+    if word_count >= story_min_words and not _is_story_complete_enough(
+        current_story, story_min_words, target_word_count, word_count
+    ):
+        logger.warning("Story has %d words but doesn't feel complete. Adding conclusion...", word_count)
         # Use only last N words for prompt to save tokens
-        last_words_for_prompt = " ".join(current_story.split()[-300:])
-        conclusion_prompt = f"""This story is {initial_word_count} words but needs a proper conclusion. Add a satisfying ending that resolves the story and feels complete. Write at least 200-400 words.
+        last_words_for_prompt = _last_words(current_story, 300)
+        conclusion_prompt = f"""This story is {word_count} words but needs a proper conclusion. Add a satisfying ending that resolves the story and feels complete. Write at least 200-400 words.
 
 **Last 300 words:**
 {last_words_for_prompt}
@@ -205,25 +602,28 @@ def _continue_story_if_needed(
         try:
             conclusion = client.generate(
                 prompt=conclusion_prompt,
-                system_prompt="Write a satisfying conclusion to this story. Make it feel complete, resolved, and emotionally satisfying. Write at least 200-400 words.",
+                system_prompt=_CONCLUSION_SYSTEM_PROMPT,
                 temperature=0.8,
                 max_tokens=min(3000, estimated_max_tokens),
             )
             current_story += " " + conclusion
-            logger.info(f"Added conclusion: {len(conclusion.split())} words (new total: {len(current_story.split())} words)")
-            if _is_story_complete_enough(current_story, story_min_words, target_word_count):
+            conclusion_word_count = _count_words(conclusion)
+            word_count += conclusion_word_count
+            logger.info("Added conclusion: %d words (new total: %d words)", conclusion_word_count, word_count)
+            if _is_story_complete_enough(current_story, story_min_words, target_word_count, word_count):
                 return current_story
         except Exception as e:
-            logger.error(f"Failed to add conclusion: {e}", exc_info=True)
+            logger.error("Failed to add conclusion: %s", e, exc_info=True)
 
     # Now, proceed with general continuation if still needed
     # CRITICAL: Keep generating until we reach the minimum word count
     for attempt in range(max_continuation_attempts):
-        word_count = len(current_story.split()) if current_story else 0
-        
         # If we've reached the minimum and it's complete, we're done
-        if _is_story_complete_enough(current_story, story_min_words, target_word_count):
-            logger.info(f"Story length OK and complete after {attempt} continuations: {word_count} words (min: {story_min_words:,}, target: {target_word_count:,})")
+        if _is_story_complete_enough(current_story, story_min_words, target_word_count, word_count):
+            logger.info(
+                "Story length OK and complete after %d continuations: %d words (min: %d, target: %d)",
+                attempt, word_count, story_min_words, target_word_count,
+            )
             return current_story
 
         # Calculate how many words we still need
@@ -231,21 +631,21 @@ def _continue_story_if_needed(
         
         # If we've somehow exceeded the minimum, check if it's complete
         if remaining_words <= 0:
-            if _is_story_complete_enough(current_story, story_min_words, target_word_count):
+            if _is_story_complete_enough(current_story, story_min_words, target_word_count, word_count):
                 return current_story
             # If it's over minimum but incomplete, try to add conclusion
             remaining_words = 500  # Add a bit more to ensure completion
 
         logger.warning(
-            f"Attempt {attempt + 1}/{max_continuation_attempts}: Story is too short: {word_count} words (min: {story_min_words:,}). "
-            f"Need {remaining_words:,} more words. Continuing generation..."
-        ) 
+            "Attempt %d/%d: Story is too short: %d words (min: %d). "
+            "Need %d more words. Continuing generation...",
+            attempt + 1, max_continuation_attempts, word_count, story_min_words, remaining_words,
+        )
 
         # Truncate the story in the prompt to avoid making prompt too long
-        story_words_for_prompt = current_story.split()
-        story_for_prompt = " ".join(story_words_for_prompt[-500:])  # Use last N words
-        if len(story_words_for_prompt) > 500:
-            logger.info(f"Truncating story in prompt to last 500 words for continuation (attempt {attempt + 1})")
+        story_for_prompt = _last_words(current_story, 500)  # Use last N words
+        if word_count > 500:
+            logger.info("Truncating story in prompt to last 500 words for continuation (attempt %d)", attempt + 1)
 
         continuation_prompt = f"""Continue and complete this short story. It's currently only {word_count} words and MUST reach at least {story_min_words:,} words. 
 
@@ -270,32 +670,38 @@ def _continue_story_if_needed(
             allocated_tokens = max(MIN_TOKENS_FOR_FULL_STORY, allocated_tokens)  # Ensure minimum for full story
 
             logger.info(
-                f"Continuation attempt {attempt + 1}: current={word_count} words, need={remaining_words} more words, "
-                f"allocating={allocated_tokens} tokens (calculated needed={continuation_tokens_needed})"
+                "Continuation attempt %d: current=%d words, need=%d more words, "
+                "allocating=%d tokens (calculated needed=%d)",
+                attempt + 1, word_count, remaining_words, allocated_tokens, continuation_tokens_needed,
             )
             
             continuation = client.generate(
                 prompt=continuation_prompt,
-                system_prompt=f"You are completing a short story. The story is currently {word_count} words. Continue writing until the story is FULLY COMPLETE and reaches at least {story_min_words:,} words. Include substantial dialogue between characters - use conversations to develop plot, reveal character, and create emotional depth. The story must end with a complete scene, preferably ending with dialogue or a narrative conclusion.",
+                system_prompt=_CONTINUATION_SYSTEM_PROMPT,
                 temperature=0.8,
                 max_tokens=allocated_tokens,
             )
             
             if continuation:
                 current_story += " " + continuation
-                logger.info(f"Continuation added: {len(continuation.split())} words (total: {len(current_story.split())} words) for attempt {attempt + 1}")
+                continuation_word_count = _count_words(continuation)
+                word_count += continuation_word_count
+                logger.info(
+                    "Continuation added: %d words (total: %d words) for attempt %d",
+                    continuation_word_count, word_count, attempt + 1,
+                )
             else:
-                logger.warning(f"LLM returned empty continuation for attempt {attempt + 1}.")
+                logger.warning("LLM returned empty continuation for attempt %d.", attempt + 1)
         except Exception as e:
-            logger.error(f"Failed to continue story on attempt {attempt + 1}: {e}", exc_info=True)
+            logger.error("Failed to continue story on attempt %d: %s", attempt + 1, e, exc_info=True)
             # Continue to next attempt if this attempt failed
 
-    final_word_count = len(current_story.split()) if current_story else 0
-    if final_word_count < story_min_words:
+    if word_count < story_min_words:
         logger.error(
-            f"CRITICAL: Story is still too short after {max_continuation_attempts} continuations: {final_word_count} words "
-            f"(minimum required: {story_min_words:,} words). This may indicate an API issue or model limitation. "
-            f"Returning partially generated story."
+            "CRITICAL: Story is still too short after %d continuations: %d words "
+            "(minimum required: %d words). This may indicate an API issue or model limitation. "
+            "Returning partially generated story.",
+            max_continuation_attempts, word_count, story_min_words,
         )
     
     # Final check to strip metadata from any continuations
@@ -304,6 +710,17 @@ def _continue_story_if_needed(
     return current_story
 
 
+# Metadata header lines (e.g. "# Story", "**Story**:", "Story: ...") together with
+# one blank line following them. Lines are matched after surrounding whitespace,
+# and a matching line is dropped whole.
+_METADATA_HEADER_PATTERN = re.compile(
+    r'^[^\S\n]*'
+    r'(?:#+[^\S\n]*(?:story|narrative|text|content)[^\S\n]*|\*\*story\*\*:.*|story:.*)'
+    r'(?:\n|\Z)(?:[^\S\n]*(?:\n|\Z))?',
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
 def _strip_metadata_from_story(text: str) -> str:
     """
     Remove metadata markers and headers from story text.
@@ -317,35 +734,22 @@ def _strip_metadata_from_story(text: str) -> str:
     if not text:
         return text
     
-    # Remove markdown headers that might indicate metadata sections
-    patterns = [
-        r'^#+\s*(Story|Narrative|Text|Content)\s*$',  # Headers like "# Story"
-        r'^##+\s*(Story|Narrative|Text|Content)\s*$',  # Headers like "## Story"
-        r'^\*\*Story\*\*:\s*',  # Bold "**Story**:"
-        r'^Story:\s*',  # Plain "Story:"
-    ]
-    
-    lines = text.split('\n')
-    cleaned_lines = []
-    skip_next_empty = False
+    # Every header the pattern matches contains "#" or ":", and most stories
+    # have neither, so skip the regex pass when both are absent
+    if '#' not in text and ':' not in text:
+        return text.strip()
     
-    for line in lines:
-        stripped = line.strip()
-        
-        # Skip metadata headers
-        if any(re.match(pattern, stripped, re.IGNORECASE) for pattern in patterns):
-            skip_next_empty = True
-            continue
-        
-        # Skip empty line after metadata header
-        if skip_next_empty and not stripped:
-            skip_next_empty = False
-            continue
-        
-        skip_next_empty = False
-        cleaned_lines.append(line)
-    
-    return '\n'.join(cleaned_lines).strip()
+    # Drop header lines and the blank line after each in a single regex pass
+    return _METADATA_HEADER_PATTERN.sub('', text).strip()
+
+
+# Markdown patterns removed from generated stories, compiled once at import
+_MARKDOWN_HEADER_PATTERN = re.compile(r'^#+\s+', re.MULTILINE)
+_MARKDOWN_BOLD_PATTERN = re.compile(r'\*\*([^*]+)\*\*')
+_MARKDOWN_ITALIC_PATTERN = re.compile(r'\*([^*]+)\*')
+_MARKDOWN_UNDERLINE_BOLD_PATTERN = re.compile(r'__([^_]+)__')
+_MARKDOWN_UNDERLINE_ITALIC_PATTERN = re.compile(r'_([^_]+)_')
+_MARKDOWN_LINK_PATTERN = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
 
 
 def _clean_markdown_from_story(text: str) -> str:
@@ -362,16 +766,16 @@ def _clean_markdown_from_story(text: str) -> str:
         return text
     
     # Remove markdown headers
-    text = re.sub(r'^#+\s+', '', text, flags=re.MULTILINE)
+    text = _MARKDOWN_HEADER_PATTERN.sub('', text)
     
     # Remove bold/italic markers (but keep the text)
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)
-    text = re.sub(r'__([^_]+)__', r'\1', text)
-    text = re.sub(r'_([^_]+)_', r'\1', text)
+    text = _MARKDOWN_BOLD_PATTERN.sub(r'\1', text)
+    text = _MARKDOWN_ITALIC_PATTERN.sub(r'\1', text)
+    text = _MARKDOWN_UNDERLINE_BOLD_PATTERN.sub(r'\1', text)
+    text = _MARKDOWN_UNDERLINE_ITALIC_PATTERN.sub(r'\1', text)
     
     # Remove links but keep text
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    text = _MARKDOWN_LINK_PATTERN.sub(r'\1', text)
     
     return text.strip()
 
@@ -439,51 +843,39 @@ def __getattr__(name: str):
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
-def generate_story_draft(
+def _prepare_story_draft(
     idea: str,
     character: Dict[str, Any],
     theme: str,
     outline: Dict[str, Any],
     scaffold: Dict[str, Any],
     genre_config: Dict[str, Any],
-    max_words: int = STORY_DEFAULT_MAX_WORDS,
-    client: Optional[BaseLLMClient] = None,
-) -> str:
+    max_words: int,
+) -> Tuple[str, str, int, int, int]:
     """
-    Generate a story draft using LLM.
+    Build the prompts and token budget for a story draft.
+    
+    Shared by generate_story_draft and generate_story_draft_async so both
+    send identical requests.
     
-    Args:
-        idea: Story idea/premise
-        character: Character description
-        theme: Story theme
-        outline: Story outline
-        scaffold: Story scaffold
-        genre_config: Genre configuration
-        max_words: Maximum word count
-        client: Optional LLMClient (uses default if None)
-        
     Returns:
-        Generated story text
+        Tuple of (system_prompt, user_prompt, story_min_words, target_words, max_tokens)
     """
-    if client is None:
-        client = get_default_client()
-    
-    # Import here to avoid circular dependency
-    from .story_prompt_builder import (
-        build_story_system_prompt,
-        build_story_user_prompt,
-        StoryParams,
-        normalize_constraints,
-    )
-    
     # Build prompts
     system_prompt = build_story_system_prompt()
     
-    # Extract character info
-    char_name = character.get("name", "the character") if isinstance(character, dict) else "the character"
-    char_desc = character.get("description", str(character)) if isinstance(character, dict) else str(character)
-    char_quirks = character.get("quirks", []) if isinstance(character, dict) else []
-    char_contradictions = character.get("contradictions", "") if isinstance(character, dict) else ""
+    # Extract character info (type-checked once, not per field)
+    if isinstance(character, dict):
+        char_name = character.get("name", "the character")
+        # Only stringify the whole character when it has no description
+        char_desc = character["description"] if "description" in character else str(character)
+        char_quirks = character.get("quirks", [])
+        char_contradictions = character.get("contradictions", "")
+    else:
+        char_name = "the character"
+        char_desc = str(character)
+        char_quirks = []
+        char_contradictions = ""
     
     # Extract outline info
     acts = outline.get("acts", {}) if isinstance(outline, dict) else {}
@@ -492,12 +884,14 @@ def generate_story_draft(
     end_label = acts.get("end", "resolution")
     
     # Extract scaffold info
-    # Import enums for default values
-    from .story_prompt_builder import Tone, Pace
-    
-    tone = scaffold.get("tone", Tone.BALANCED.value) if isinstance(scaffold, dict) else Tone.BALANCED.value
-    pace = scaffold.get("pace", Pace.MODERATE.value) if isinstance(scaffold, dict) else Pace.MODERATE.value
-    pov = scaffold.get("pov", "third person") if isinstance(scaffold, dict) else "third person"
+    if isinstance(scaffold, dict):
+        tone = scaffold.get("tone", Tone.BALANCED.value)
+        pace = scaffold.get("pace", Pace.MODERATE.value)
+        pov = scaffold.get("pov", "third person")
+    else:
+        tone = Tone.BALANCED.value
+        pace = Pace.MODERATE.value
+        pov = "third person"
     
     # Normalize constraints to ensure proper typing
     raw_constraints = genre_config.get("constraints", {})
@@ -526,7 +920,7 @@ def generate_story_draft(
     # Calculate max_tokens from target_words (convert words to tokens)
     # target_words is a word count, but we need tokens for the LLM API
     # CRITICAL: Use the FULL token budget (8192) for initial generation to maximize output
-    estimated_max_tokens = int(target_words * TOKENS_PER_WORD_ESTIMATE * TOKEN_BUFFER_MULTIPLIER) + TOKEN_BUFFER_ADDITION
+    estimated_max_tokens = _tokens_for_word_count(target_words)
     # Always use maximum available tokens for initial generation to avoid premature truncation
     estimated_max_tokens = min(estimated_max_tokens, GEMINI_MAX_OUTPUT_TOKENS)
     # Ensure we use at least MIN_TOKENS_FOR_FULL_STORY, but prefer maximum if we can
@@ -536,35 +930,42 @@ def generate_story_draft(
     # This reduces the chance of hitting MAX_TOKENS before reaching minimum word count
     if estimated_max_tokens < GEMINI_MAX_OUTPUT_TOKENS:
         logger.info(
-            f"Boosting initial generation tokens from {estimated_max_tokens} to {GEMINI_MAX_OUTPUT_TOKENS} "
-            f"to maximize story length (target: {target_words} words)"
+            "Boosting initial generation tokens from %d to %d to maximize story length (target: %d words)",
+            estimated_max_tokens, GEMINI_MAX_OUTPUT_TOKENS, target_words,
         )
         estimated_max_tokens = GEMINI_MAX_OUTPUT_TOKENS
     
-    # Generate initial draft
-    logger.info(f"Generating story draft: target_words={target_words}, max_words={max_words}, max_tokens={estimated_max_tokens}")
-    story_text = client.generate(
-        prompt=user_prompt,
-        system_prompt=system_prompt,
-        temperature=0.8,
-        max_tokens=estimated_max_tokens,
-    )
+    return system_prompt, user_prompt, story_min_words, target_words, estimated_max_tokens
+
+
+def _finalize_story_draft(
+    story_text: str,
+    story_min_words: int,
+    target_words: int,
+    max_words: int,
+    estimated_max_tokens: int,
+    client: BaseLLMClient,
+) -> str:
+    """
+    Clean up a generated draft and continue it if it is short or truncated.
     
+    Returns:
+        Final story text
+    """
     # Clean up the story text
     story_text = _strip_metadata_from_story(story_text)
     story_text = _clean_markdown_from_story(story_text)
     
     # Check initial word count
-    initial_word_count = len(story_text.split()) if story_text else 0
+    initial_word_count = _count_words(story_text)
     logger.info(
-        f"Initial story generation complete: {initial_word_count} words "
-        f"(minimum required: {story_min_words}, target: {target_words})"
+        "Initial story generation complete: %d words (minimum required: %d, target: %d)",
+        initial_word_count, story_min_words, target_words,
     )
     
     # Check if story ends properly (not cut off mid-sentence)
     # This catches MAX_TOKENS truncation even when word count is met
-    stripped = story_text.rstrip() if story_text else ""
-    ends_properly = stripped.endswith(('.', '!', '?', '"', "'")) if stripped else False
+    ends_properly = _ends_with_terminal(story_text) if story_text else False
     
     # Continue story if needed (client is guaranteed to be non-None here)
     target_word_count = int(max_words * TARGET_WORD_COUNT_RATIO)
@@ -574,7 +975,9 @@ def generate_story_draft(
     
     # CRITICAL: Continue if:
     # 1. Under minimum word count (always continue)
-    # 2. Meets word count but doesn't end properly (likely truncated by MAX_TOKENS)
+    # 2. Meets word count but doesn't end properly (likely truncated by MAX_TOKENS),
+    #    unless it is already close enough to the target that a continuation
+    #    call would only add length past what was asked for
     # 3. Meets word count but doesn't feel complete
     should_continue = False
     continuation_reason = ""
@@ -582,16 +985,23 @@ def generate_story_draft(
     if initial_word_count < story_min_words:
         should_continue = True
         continuation_reason = f"below minimum ({initial_word_count} < {story_min_words})"
-    elif not ends_properly:
+    elif not ends_properly and initial_word_count < target_word_count * NEAR_TARGET_WORD_COUNT_RATIO:
         should_continue = True
-        continuation_reason = f"ends mid-sentence (likely MAX_TOKENS truncation) - last 50 chars: '{stripped[-50:]}'"
-    elif not _is_story_complete_enough(story_text, story_min_words, target_word_count):
+        # Drafts are stripped by the cleanup above, so the slice is the real ending
+        continuation_reason = f"ends mid-sentence (likely MAX_TOKENS truncation) - last 50 chars: {story_text[-50:]!r}"
+    elif not _is_story_complete_enough(story_text, story_min_words, target_word_count, initial_word_count):
         should_continue = True
         continuation_reason = "doesn't feel complete"
+    elif not ends_properly:
+        logger.warning(
+            "Accepting draft that ends mid-sentence because it is near the target "
+            "(%d words, target: %d). Last 50 chars: %r",
+            initial_word_count, target_word_count, story_text[-50:],
+        )
     
     if should_continue:
         logger.warning(
-            f"Story {continuation_reason}. FORCING continuation to ensure complete story."
+            "Story %s. FORCING continuation to ensure complete story.", continuation_reason
         )
         max_attempts = 10 if initial_word_count < story_min_words else 5
         story_text = _continue_story_if_needed(
@@ -606,6 +1016,150 @@ def generate_story_draft(
     return story_text
 
 
+def generate_story_draft(
+    idea: str,
+    character: Dict[str, Any],
+    theme: str,
+    outline: Dict[str, Any],
+    scaffold: Dict[str, Any],
+    genre_config: Dict[str, Any],
+    max_words: int = STORY_DEFAULT_MAX_WORDS,
+    client: Optional[BaseLLMClient] = None,
+) -> str:
+    """
+    Generate a story draft using LLM.
+    
+    Args:
+        idea: Story idea/premise
+        character: Character description
+        theme: Story theme
+        outline: Story outline
+        scaffold: Story scaffold
+        genre_config: Genre configuration
+        max_words: Maximum word count
+        client: Optional LLMClient (uses default if None)
+        
+    Returns:
+        Generated story text
+    """
+    if client is None:
+        client = get_default_client()
+    
+    system_prompt, user_prompt, story_min_words, target_words, estimated_max_tokens = _prepare_story_draft(
+        idea, character, theme, outline, scaffold, genre_config, max_words
+    )
+    
+    # Generate initial draft
+    logger.info(
+        "Generating story draft: target_words=%d, max_words=%d, max_tokens=%d",
+        target_words, max_words, estimated_max_tokens,
+    )
+    story_text = client.generate(
+        prompt=user_prompt,
+        system_prompt=system_prompt,
+        temperature=0.8,
+        max_tokens=estimated_max_tokens,
+    )
+    
+    story_text = _finalize_story_draft(
+        story_text, story_min_words, target_words, max_words, estimated_max_tokens, client
+    )
+    return story_text
+
+
+async def generate_story_draft_async(
+    idea: str,
+    character: Dict[str, Any],
+    theme: str,
+    outline: Dict[str, Any],
+    scaffold: Dict[str, Any],
+    genre_config: Dict[str, Any],
+    max_words: int = STORY_DEFAULT_MAX_WORDS,
+    client: Optional[BaseLLMClient] = None,
+) -> str:
+    """
+    Async variant of generate_story_draft.
+    
+    The initial draft is requested with client.generate_async, so several
+    stories can be drafted concurrently with asyncio.gather. Cleanup and any
+    continuation requests run in a worker thread to keep the event loop free.
+    
+    Args:
+        idea: Story idea/premise
+        character: Character description
+        theme: Story theme
+        outline: Story outline
+        scaffold: Story scaffold
+        genre_config: Genre configuration
+        max_words: Maximum word count
+        client: Optional LLMClient (uses default if None)
+        
+    Returns:
+        Generated story text
+    """
+    if client is None:
+        client = get_default_client()
+    
+    system_prompt, user_prompt, story_min_words, target_words, estimated_max_tokens = _prepare_story_draft(
+        idea, character, theme, outline, scaffold, genre_config, max_words
+    )
+    
+    logger.info(
+        "Generating story draft (async): target_words=%d, max_words=%d, max_tokens=%d",
+        target_words, max_words, estimated_max_tokens,
+    )
+    story_text = await client.generate_async(
+        prompt=user_prompt,
+        system_prompt=system_prompt,
+        temperature=0.8,
+        max_tokens=estimated_max_tokens,
+    )
+    
+    story_text = await asyncio.to_thread(
+        _finalize_story_draft,
+        story_text, story_min_words, target_words, max_words, estimated_max_tokens, client,
+    )
+    return story_text
+
+
+async def generate_story_drafts_async(
+    requests: List[Dict[str, Any]],
+    max_concurrency: int = BATCH_GENERATE_MAX_WORKERS,
+    client: Optional[BaseLLMClient] = None,
+) -> List[str]:
+    """
+    Draft several stories concurrently on one event loop.
+    
+    Each request holds the keyword arguments of generate_story_draft_async
+    (idea, character, theme, outline, scaffold, genre_config and optionally
+    max_words). At most max_concurrency drafts are in flight at once, so a
+    large batch does not open an unbounded number of provider requests.
+    
+    Args:
+        requests: Draft arguments, one dict per story
+        max_concurrency: Maximum number of drafts generated at the same time
+        client: Optional LLMClient shared by all drafts (uses default if None)
+        
+    Returns:
+        Generated story texts, in the same order as requests
+        
+    Raises:
+        Exception: The first error raised by any draft
+    """
+    if not requests:
+        return []
+    if client is None:
+        client = get_default_client()
+    
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    
+    async def draft(request: Dict[str, Any]) -> str:
+        async with semaphore:
+            return await generate_story_draft_async(client=client, **request)
+    
+    return list(await asyncio.gather(*(draft(request) for request in requests)))
+
+
 def revise_story_text(
     text: str,
     revision_notes: List[str],
@@ -629,8 +1183,15 @@ def revise_story_text(
     if client is None:
         client = get_default_client()
     
-    # Import here to avoid circular dependency
-    from .story_prompt_builder import build_revision_system_prompt, build_revision_user_prompt
+    cache_key = None
+    if _response_cache_size > 0:
+        cache_key = _response_cache_key(
+            "revision", client.model_name, text, revision_notes, current_words, max_words
+        )
+        cached = _get_cached_response(cache_key)
+        if cached is not None:
+            logger.info("Returning cached story revision")
+            return cached
     
     # Build prompts
     system_prompt = build_revision_system_prompt()
@@ -644,20 +1205,23 @@ def revise_story_text(
     
     # Calculate max_tokens from target_words (convert words to tokens)
     # target_words is a word count, but we need tokens for the LLM API
-    estimated_max_tokens = int(target_words * TOKENS_PER_WORD_ESTIMATE * TOKEN_BUFFER_MULTIPLIER) + TOKEN_BUFFER_ADDITION
+    estimated_max_tokens = _tokens_for_word_count(target_words)
     estimated_max_tokens = min(estimated_max_tokens, GEMINI_MAX_OUTPUT_TOKENS)
     estimated_max_tokens = max(estimated_max_tokens, MIN_TOKENS_FOR_FULL_STORY)
     
     # For revisions, also use full token budget to ensure complete output
     if estimated_max_tokens < GEMINI_MAX_OUTPUT_TOKENS:
         logger.info(
-            f"Boosting revision tokens from {estimated_max_tokens} to {GEMINI_MAX_OUTPUT_TOKENS} "
-            f"to maximize story expansion (target: {target_words} words)"
+            "Boosting revision tokens from %d to %d to maximize story expansion (target: %d words)",
+            estimated_max_tokens, GEMINI_MAX_OUTPUT_TOKENS, target_words,
         )
         estimated_max_tokens = GEMINI_MAX_OUTPUT_TOKENS
     
     # Generate revision
-    logger.info(f"Revising story: current_words={current_words}, max_words={max_words}, target_words={target_words}, max_tokens={estimated_max_tokens}")
+    logger.info(
+        "Revising story: current_words=%d, max_words=%d, target_words=%d, max_tokens=%d",
+        current_words, max_words, target_words, estimated_max_tokens,
+    )
     revised_text = client.generate(
         prompt=user_prompt,
         system_prompt=system_prompt,
@@ -670,23 +1234,22 @@ def revise_story_text(
     revised_text = _clean_markdown_from_story(revised_text)
     
     # CRITICAL: Check if revision reduced word count or is incomplete
-    revised_word_count = len(revised_text.split()) if revised_text else 0
-    stripped_revised = revised_text.rstrip() if revised_text else ""
-    revised_ends_properly = stripped_revised.endswith(('.', '!', '?', '"', "'")) if stripped_revised else False
+    revised_word_count = _count_words(revised_text)
+    revised_ends_properly = _ends_with_terminal(revised_text) if revised_text else False
     
     # If revision reduced word count or doesn't end properly, we need to continue
     if revised_word_count < current_words:
         logger.warning(
-            f"Revision REDUCED word count from {current_words} to {revised_word_count}. "
-            f"This should not happen. Original text may have been better."
+            "Revision REDUCED word count from %d to %d. "
+            "This should not happen. Original text may have been better.",
+            current_words, revised_word_count,
         )
     if not revised_ends_properly:
         logger.warning(
-            f"Revised story ends mid-sentence (likely MAX_TOKENS truncation). "
-            f"Last 50 chars: '{stripped_revised[-50:]}'"
+            "Revised story ends mid-sentence (likely MAX_TOKENS truncation). Last 50 chars: %r",
+            revised_text[-50:],
         )
         # Force continuation to complete the revised story
-        from .llm_constants import STORY_MIN_WORDS
         min_words_for_revision = max(current_words, STORY_MIN_WORDS)
         revised_text = _continue_story_if_needed(
             story_text=revised_text,
@@ -697,6 +1260,7 @@ def revise_story_text(
             max_continuation_attempts=5,
         )
     
+    _store_cached_response(cache_key, revised_text)
     return revised_text
 
 
@@ -713,13 +1277,14 @@ def generate_outline_structure(
         premise: Story premise
         genre: Story genre
         genre_config: Genre configuration
-        client: Optional LLMClient (uses default if None)
+        client: Optional LLMClient (unused while the outline is template-based)
         
     Returns:
         Outline structure dictionary
     """
-    if client is None:
-        client = get_default_client()
+    # Built from the genre config without a model call, so no default client
+    # is created; that would only pay for provider setup (and fail without an
+    # API key) for a result that never uses it.
     
     # Simple template-based outline generation
     # In a full implementation, this would use LLM to generate detailed beats
@@ -734,7 +1299,7 @@ def generate_outline_structure(
         },
     }
     
-    logger.info(f"Generated outline structure for genre: {genre}")
+    logger.info("Generated outline structure for genre: %s", genre)
     return outline
 
 
@@ -751,20 +1316,17 @@ def generate_scaffold_structure(
         premise: Story premise
         outline: Story outline
         genre_config: Genre configuration
-        client: Optional LLMClient (uses default if None)
+        client: Optional LLMClient (unused while the scaffold is template-based)
         
     Returns:
         Scaffold structure dictionary
     """
-    if client is None:
-        client = get_default_client()
+    # Built from the genre constraints without a model call, so no default
+    # client is created.
     
     # Extract constraints from genre config
     constraints = genre_config.get("constraints", {})
     
-    # Import enums for default values
-    from .story_prompt_builder import Tone, Pace
-    
     scaffold = {
         "tone": constraints.get("tone", Tone.BALANCED.value),
         "pace": constraints.get("pace", Pace.MODERATE.value),
@@ -29,6 +29,10 @@ INDUSTRY_MAX_WORDS = 7500
 # When calculating target word count, use this ratio of max words
 TARGET_WORD_COUNT_RATIO = 0.75  # e.g., 6500 * 0.75 = 4875 words
 
+# Drafts within this fraction of the target word count are not continued just
+# because their last character does not look like the end of a sentence
+NEAR_TARGET_WORD_COUNT_RATIO = 0.95
+
 # Token Limits for Gemini API
 # Maximum output tokens supported by Gemini models
 GEMINI_MAX_OUTPUT_TOKENS = 8192
@@ -56,6 +60,9 @@ TOKEN_BUFFER_ADDITION = 10
 # Rough estimate: 1 token ≈ 4 characters (accounts for punctuation)
 CHARS_PER_TOKEN_ESTIMATE = 4.0
 
+# Texts at or below this length (labels, names) are estimated without tokenizing
+SHORT_TEXT_MAX_CHARS = 24
+
 # Word-based token estimation
 # Average tokens per word for English text
 TOKENS_PER_WORD_CHAR_ESTIMATE = 1.4
@@ -64,6 +71,19 @@ TOKENS_PER_WORD_CHAR_ESTIMATE = 1.4
 # When expanding stories, use this multiplier for token calculation
 WORD_COUNT_EXPANSION_MULTIPLIER = 1.2
 
+# Batch Generation
+# Default number of worker threads used by BaseLLMClient.batch_generate
+BATCH_GENERATE_MAX_WORKERS = 8
+
+# Attempts per prompt before a batch request is reported as failed
+BATCH_RETRY_ATTEMPTS = 3
+
+# Base delay in seconds for exponential backoff between attempts
+BATCH_RETRY_BASE_DELAY = 2.0
+
+# Minimum delay in seconds after a rate limit (HTTP 429) response
+BATCH_RATE_LIMIT_MIN_DELAY = 10.0
+
 # Standard Story Structure Template
 # Consistent 5-part structure for all stories (maximizes learnability)
 # Each story follows this architecture regardless of genre
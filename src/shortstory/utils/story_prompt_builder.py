@@ -27,7 +27,7 @@ Use normalize_constraints() to convert Dict[str, Any] to GenreConstraints.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Tuple, TypedDict
+from typing import Dict, Iterator, List, Optional, Any, Tuple, TypedDict
 from enum import Enum
 
 from .llm_constants import (
@@ -145,14 +145,10 @@ class RevisionParams:
     max_words: int
 
 
-def build_story_system_prompt() -> str:
-    """
-    Build the system prompt for story generation.
-    
-    Returns:
-        System prompt string for story generation
-    """
-    return f"""You are an expert short story writer specializing in distinctive, memorable narratives.
+# System prompts are fully static, so they are formatted once at import.
+# Returning the same string object on every call keeps the prompt prefix
+# byte-identical across requests and lets token counts be cached.
+_STORY_SYSTEM_PROMPT = f"""You are an expert short story writer specializing in distinctive, memorable narratives.
 
 Your task is to generate a complete short story that:
 1. Tells a compelling, original story with a single sharp core idea
@@ -182,48 +178,69 @@ WRITING QUALITY REQUIREMENTS:
 Provide ONLY the story text, without any metadata or headers."""
 
 
-def build_story_user_prompt(params: StoryParams) -> Tuple[str, int, int, int]:
+def build_story_system_prompt() -> str:
     """
-    Build the user prompt for story generation.
+    Build the system prompt for story generation.
+    
+    Returns:
+        System prompt string for story generation
+    """
+    return _STORY_SYSTEM_PROMPT
+
+
+# Word count block that closes every story prompt. Only the target varies per
+# call; the story limits are formatted in here once at import.
+_STORY_WORD_COUNT_TEMPLATE = (
+    "**CRITICAL WORD COUNT REQUIREMENT:**\n"
+    f"- MINIMUM: The story MUST be at least {STORY_MIN_WORDS:,} words (this is mandatory, not optional)\n"
+    "- TARGET: Aim for {target_words:,} words\n"
+    f"- MAXIMUM: Do not exceed {STORY_MAX_WORDS:,} words\n"
+    f"- DO NOT STOP WRITING until you have written at least {STORY_MIN_WORDS:,} words\n"
+    f"- If you find yourself ending the story before {STORY_MIN_WORDS:,} words, you MUST continue with more scenes, dialogue, character development, or plot resolution"
+)
+
+
+def _iter_story_prompt_lines(params: StoryParams, target_words: int) -> Iterator[str]:
+    """
+    Yield the lines of the story user prompt in order.
     
     Args:
         params: Story parameters dataclass
+        target_words: Target word count for the story
         
-    Returns:
-        Tuple of (prompt, min_words, max_words, target_words)
+    Yields:
+        Prompt lines, to be joined with newlines
     """
-    prompt_parts = []
-    
     # Story idea
-    prompt_parts.append(f"**Story Idea (Single Sharp Core):** {params.idea}\n")
+    yield f"**Story Idea (Single Sharp Core):** {params.idea}\n"
     
     # Character details
-    prompt_parts.append(f"**Character:**")
-    prompt_parts.append(f"- Name: {params.char_name}")
-    prompt_parts.append(f"- Description: {params.char_desc}")
+    yield "**Character:**"
+    yield f"- Name: {params.char_name}"
+    yield f"- Description: {params.char_desc}"
     if params.char_quirks:
-        prompt_parts.append(f"- Quirks: {', '.join(params.char_quirks)}")
+        yield f"- Quirks: {', '.join(params.char_quirks)}"
     if params.char_contradictions:
-        prompt_parts.append(f"- Contradictions: {params.char_contradictions}")
-    prompt_parts.append("")
+        yield f"- Contradictions: {params.char_contradictions}"
+    yield ""
     
     # Theme
     if params.theme:
-        prompt_parts.append(f"**Theme:** {params.theme}\n")
+        yield f"**Theme:** {params.theme}\n"
     
     # Structure
-    prompt_parts.append(f"**Story Structure:**")
-    prompt_parts.append(f"- Beginning: {params.beginning_label}")
-    prompt_parts.append(f"- Middle: {params.middle_label}")
-    prompt_parts.append(f"- End: {params.end_label}")
-    prompt_parts.append("")
+    yield "**Story Structure:**"
+    yield f"- Beginning: {params.beginning_label}"
+    yield f"- Middle: {params.middle_label}"
+    yield f"- End: {params.end_label}"
+    yield ""
     
     # Voice and style
-    prompt_parts.append(f"**Narrative Voice:**")
-    prompt_parts.append(f"- POV: {params.pov}")
-    prompt_parts.append(f"- Tone: {params.tone}")
-    prompt_parts.append(f"- Pace: {params.pace}")
-    prompt_parts.append("")
+    yield "**Narrative Voice:**"
+    yield f"- POV: {params.pov}"
+    yield f"- Tone: {params.tone}"
+    yield f"- Pace: {params.pace}"
+    yield ""
     
     # Genre-specific guidance
     if params.constraints:
@@ -233,24 +250,30 @@ def build_story_user_prompt(params: StoryParams) -> Tuple[str, int, int, int]:
             constraints=params.constraints
         )
         if guidance:
-            prompt_parts.append("**Genre-Specific Guidance:**")
+            yield "**Genre-Specific Guidance:**"
             # Format guidance keys into readable labels
             for key, value in guidance.items():
                 # Convert snake_case to Title Case with spaces
                 label = key.replace('_', ' ').title()
-                prompt_parts.append(f"- {label}: {value}")
-            prompt_parts.append("")
+                yield f"- {label}: {value}"
+            yield ""
     
     # Word count requirements - make this VERY explicit
-    target_words = int(params.max_words * TARGET_WORD_COUNT_RATIO)
-    prompt_parts.append(f"**CRITICAL WORD COUNT REQUIREMENT:**")
-    prompt_parts.append(f"- MINIMUM: The story MUST be at least {STORY_MIN_WORDS:,} words (this is mandatory, not optional)")
-    prompt_parts.append(f"- TARGET: Aim for {target_words:,} words")
-    prompt_parts.append(f"- MAXIMUM: Do not exceed {STORY_MAX_WORDS:,} words")
-    prompt_parts.append(f"- DO NOT STOP WRITING until you have written at least {STORY_MIN_WORDS:,} words")
-    prompt_parts.append(f"- If you find yourself ending the story before {STORY_MIN_WORDS:,} words, you MUST continue with more scenes, dialogue, character development, or plot resolution")
+    yield _STORY_WORD_COUNT_TEMPLATE.format(target_words=target_words)
+
+
+def build_story_user_prompt(params: StoryParams) -> Tuple[str, int, int, int]:
+    """
+    Build the user prompt for story generation.
     
-    prompt = "\n".join(prompt_parts)
+    Args:
+        params: Story parameters dataclass
+        
+    Returns:
+        Tuple of (prompt, min_words, max_words, target_words)
+    """
+    target_words = int(params.max_words * TARGET_WORD_COUNT_RATIO)
+    prompt = "\n".join(_iter_story_prompt_lines(params, target_words))
     
     return prompt, STORY_MIN_WORDS, STORY_MAX_WORDS, target_words
 
@@ -437,14 +460,7 @@ def _has_genre_keyword(constraints: GenreConstraints, keyword: str) -> bool:
     return False
 
 
-def build_revision_system_prompt() -> str:
-    """
-    Build the system prompt for story revision.
-    
-    Returns:
-        System prompt string for story revision
-    """
-    return """You are an expert story editor specializing in refining short stories.
+_REVISION_SYSTEM_PROMPT = """You are an expert story editor specializing in refining short stories.
 
 Your task is to revise a story to:
 1. Improve clarity, flow, and impact
@@ -457,6 +473,43 @@ CRITICAL: You must provide the COMPLETE revised story, not just changes or sugge
 The output must be a full, polished narrative ready for publication."""
 
 
+def build_revision_system_prompt() -> str:
+    """
+    Build the system prompt for story revision.
+    
+    Returns:
+        System prompt string for story revision
+    """
+    return _REVISION_SYSTEM_PROMPT
+
+
+# Static revision requirements shared by every revision prompt; the length
+# requirement (item 5) is appended per call.
+_REVISION_REQUIREMENTS = (
+    "**Revision Requirements:**\n"
+    "1. Improve clarity and flow\n"
+    "2. Enhance distinctive voice\n"
+    "3. Remove clichés and generic language\n"
+    "4. Strengthen character development"
+)
+
+
+# Full revision prompt. Only the story, optional notes and the three word count
+# messages vary per call, so the prompt is produced by a single format() call.
+_REVISION_USER_PROMPT_TEMPLATE = (
+    "**Current Story:**\n"
+    "{text}\n"
+    "\n"
+    "{notes_section}"
+    "{length_instruction}\n"
+    "\n"
+    f"{_REVISION_REQUIREMENTS}\n"
+    "{requirements_section}\n"
+    "\n"
+    "{final_instruction}"
+)
+
+
 def _get_word_count_messages(
     current_words: int,
     story_min_words: int,
@@ -553,19 +606,11 @@ def build_revision_user_prompt(
     Returns:
         Tuple of (prompt, min_words, max_words, target_words)
     """
-    prompt_parts = []
-    
-    # Current story
-    prompt_parts.append("**Current Story:**")
-    prompt_parts.append(text)
-    prompt_parts.append("")
-    
     # Revision notes
+    notes_section = ""
     if revision_notes:
-        prompt_parts.append("**Revision Instructions:**")
-        for i, note in enumerate(revision_notes, 1):
-            prompt_parts.append(f"{i}. {note}")
-        prompt_parts.append("")
+        numbered_notes = "\n".join(f"{i}. {note}" for i, note in enumerate(revision_notes, 1))
+        notes_section = f"**Revision Instructions:**\n{numbered_notes}\n\n"
     
     # Word count messages
     story_min_words = STORY_MIN_WORDS
@@ -579,17 +624,10 @@ def build_revision_user_prompt(
         target_words=target_words,
     )
     
-    prompt_parts.append(messages["length_instruction"])
-    prompt_parts.append("")
-    prompt_parts.append("**Revision Requirements:**")
-    prompt_parts.append("1. Improve clarity and flow")
-    prompt_parts.append("2. Enhance distinctive voice")
-    prompt_parts.append("3. Remove clichés and generic language")
-    prompt_parts.append("4. Strengthen character development")
-    prompt_parts.append(messages["requirements_section"])
-    prompt_parts.append("")
-    prompt_parts.append(messages["final_instruction"])
-    
-    prompt = "\n".join(prompt_parts)
+    prompt = _REVISION_USER_PROMPT_TEMPLATE.format(
+        text=text,
+        notes_section=notes_section,
+        **messages,
+    )
     
     return prompt, story_min_words, story_max_words, target_words
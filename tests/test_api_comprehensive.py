@@ -126,7 +126,7 @@ class TestGenerateEndpoint:
         """Test that invalid character type is rejected."""
         payload = {
             "idea": "A test story idea",
-            "character": "not a dict",  # Invalid type
+            "character": 12345,  # Invalid type (strings are accepted as descriptions)
             "theme": "Test theme",
             "genre": "General Fiction"
         }
@@ -0,0 +1,302 @@
+"""
+Tests for error handling utilities.
+
+Tests cover the custom exception hierarchy and structured error responses.
+"""
+
+import pytest
+
+from src.shortstory.utils.errors import (
+    APIError,
+    ValidationError,
+    NotFoundError,
+    RateLimitError,
+    ServiceUnavailableError,
+    MissingDependencyError,
+    StorageError,
+    DataIntegrityError,
+    DatabaseConnectionError,
+)
+
+
+class TestErrorClasses:
+    """Test custom exception classes."""
+
+    def test_storage_error_subclasses_set_error_code(self):
+        """Test that storage error subclasses carry their own error codes."""
+        assert StorageError("failed").error_code == "STORAGE_ERROR"
+        assert DataIntegrityError("bad data").error_code == "DATA_INTEGRITY_ERROR"
+        assert DatabaseConnectionError("no db").error_code == "DATABASE_CONNECTION_ERROR"
+
+    def test_storage_error_subclasses_keep_status_and_details(self):
+        """Test that storage subclasses forward message and details."""
+        error = DataIntegrityError("bad data", {"field": "id"})
+        assert error.message == "bad data"
+        assert error.status_code == 500
+        assert error.details == {"field": "id"}
+
+    def test_to_response_payload(self):
+        """Test that APIError builds its own payload and status."""
+        payload, status = NotFoundError("Story", "abc").to_response_payload()
+        assert status == 404
+        assert payload["error_code"] == "NOT_FOUND"
+        assert payload["details"] == {"resource_type": "Story", "resource_id": "abc"}
+
+    def test_to_response_payload_omits_empty_details(self):
+        """Test that empty details are left out of the payload."""
+        payload, status = ValidationError("invalid").to_response_payload()
+        assert status == 400
+        assert payload == {"error": "invalid", "error_code": "VALIDATION_ERROR"}
+
+    def test_rate_limit_error_without_retry_after(self):
+        """Test the default rate limit error."""
+        error = RateLimitError()
+        assert error.message == "Rate limit exceeded. Please try again later."
+        assert error.status_code == 429
+        assert not error.details
+
+    def test_rate_limit_error_with_retry_after(self):
+        """Test that retry_after is reported in message and details."""
+        error = RateLimitError(retry_after=30)
+        assert error.message.endswith("Retry after 30 seconds.")
+        assert error.details == {"retry_after": 30}
+
+    def test_errors_without_details_share_empty_mapping(self):
+        """Test that errors without details share one read-only mapping."""
+        first = ValidationError("one")
+        second = APIError("two", "OTHER", details={})
+        assert not first.details
+        assert first.details is second.details
+        with pytest.raises(TypeError):
+            first.details["key"] = "value"
+
+    @pytest.mark.parametrize("error", [
+        APIError("boom", "SOME_ERROR"),
+        ValidationError("invalid"),
+        NotFoundError("Story", "abc"),
+        RateLimitError(),
+        ServiceUnavailableError("llm"),
+        MissingDependencyError("reportlab", "pip install reportlab"),
+        StorageError("failed"),
+        DataIntegrityError("bad data"),
+        DatabaseConnectionError("no db"),
+    ])
+    def test_error_attributes_use_slots(self, error):
+        """Test that API error attributes are stored in slots."""
+        for name in APIError.__slots__:
+            assert name not in error.__dict__
+            assert hasattr(error, name)
+
+
+class TestTracebackFormatting:
+    """Test bounded traceback formatting."""
+
+    def test_format_traceback_includes_exception(self):
+        """Test that formatted traceback names the exception."""
+        from src.shortstory.utils.errors import _format_traceback
+
+        try:
+            raise ValueError("broken")
+        except ValueError as e:
+            formatted = _format_traceback(e)
+
+        assert formatted.startswith("Traceback")
+        assert "ValueError: broken" in formatted
+
+    def test_format_traceback_respects_limit(self):
+        """Test that frame depth is capped by the limit argument."""
+        from src.shortstory.utils.errors import _format_traceback
+
+        def recurse(depth):
+            if depth == 0:
+                raise RuntimeError("deep")
+            recurse(depth - 1)
+
+        try:
+            recurse(10)
+        except RuntimeError as e:
+            formatted = _format_traceback(e, limit=3)
+
+        assert formatted.count("File ") == 3
+
+
+class TestErrorHandlers:
+    """Test error handlers registered on a Flask app."""
+
+    def _make_app(self, debug):
+        from flask import Flask
+        from src.shortstory.utils.errors import register_error_handlers
+
+        app = Flask(__name__)
+
+        @app.route("/api-error")
+        def api_error():
+            raise ValidationError("bad input", {"field": "idea"})
+
+        @app.route("/crash")
+        def crash():
+            raise RuntimeError("internal detail")
+
+        register_error_handlers(app, debug=debug)
+        return app.test_client()
+
+    def test_prod_handler_hides_internal_message(self):
+        """Test that production mode hides messages and tracebacks."""
+        client = self._make_app(debug=False)
+        response = client.get("/crash")
+        data = response.get_json()
+
+        assert response.status_code == 500
+        assert data["error_code"] == "INTERNAL_ERROR"
+        assert "internal detail" not in data["error"]
+        assert "traceback" not in data
+
+    def test_debug_handler_exposes_message_and_traceback(self):
+        """Test that debug mode includes real messages and tracebacks."""
+        client = self._make_app(debug=True)
+        response = client.get("/crash")
+        data = response.get_json()
+
+        assert response.status_code == 500
+        assert data["error"] == "internal detail"
+        assert "RuntimeError" in data["traceback"]
+
+    @pytest.mark.parametrize("debug", [False, True])
+    def test_api_error_response_includes_details(self, debug):
+        """Test that APIError responses carry code, message and details."""
+        client = self._make_app(debug=debug)
+        response = client.get("/api-error")
+        data = response.get_json()
+
+        assert response.status_code == 400
+        assert data["error"] == "bad input"
+        assert data["error_code"] == "VALIDATION_ERROR"
+        assert data["details"] == {"field": "idea"}
+        assert ("traceback" in data) is debug
+
+    def test_not_found_handler(self):
+        """Test that unknown routes return a structured 404."""
+        client = self._make_app(debug=False)
+        response = client.get("/missing")
+
+        assert response.status_code == 404
+        assert response.get_json()["error_code"] == "NOT_FOUND"
+
+
+class TestParseErrorResponse:
+    """Test parsing of upstream error responses."""
+
+    def test_parse_json_error_fields(self):
+        """Test that standard JSON error fields are extracted."""
+        from src.shortstory.utils.errors import parse_error_response
+
+        body = '{"error": "Bad key", "error_code": "AUTH", "details": {"hint": "rotate"}}'
+        info = parse_error_response(body, 401)
+
+        assert info["error"] == "Bad key"
+        assert info["error_code"] == "AUTH"
+        assert info["details"] == {"hint": "rotate"}
+        assert info["full_response"]["error_code"] == "AUTH"
+
+    def test_parse_json_without_error_fields_keeps_defaults(self):
+        """Test that JSON without error fields keeps HTTP defaults."""
+        from src.shortstory.utils.errors import parse_error_response
+
+        info = parse_error_response('{"message": "nope"}', 502)
+
+        assert info["error"] == "API request failed with status 502"
+        assert info["error_code"] == "HTTP_502"
+        assert "full_response" not in info
+
+    def test_parse_plain_text_is_truncated(self):
+        """Test that non-JSON bodies are returned as truncated raw text."""
+        from src.shortstory.utils.errors import parse_error_response
+
+        info = parse_error_response("x" * 1500, 500)
+
+        assert len(info["raw_text"]) == 1000
+        assert info["raw_text_truncated"] is True
+
+    def test_parse_empty_response(self):
+        """Test that empty bodies produce an explicit message."""
+        from src.shortstory.utils.errors import parse_error_response
+
+        info = parse_error_response("", 503)
+
+        assert "empty response" in info["error"]
+        assert info["status_code"] == 503
+
+    def test_parse_invalid_json_falls_back_to_raw_text(self):
+        """Test that malformed JSON is reported as raw text."""
+        from src.shortstory.utils.errors import parse_error_response
+
+        info = parse_error_response('{"error": ', 500)
+
+        assert info["raw_text"] == '{"error": '
+        assert info["error_code"] == "HTTP_500"
+
+
+class TestLogError:
+    """Test error logging."""
+
+    def test_log_error_skipped_when_level_disabled(self, monkeypatch):
+        """Test that nothing is logged when ERROR is filtered out."""
+        from unittest.mock import MagicMock
+        from src.shortstory.utils import errors
+
+        mock_logger = MagicMock()
+        mock_logger.isEnabledFor.return_value = False
+        monkeypatch.setattr(errors, "logger", mock_logger)
+
+        errors._log_error(ValueError("quiet"))
+
+        mock_logger.error.assert_not_called()
+
+    def test_log_error_attaches_exception(self, monkeypatch):
+        """Test that the logged record carries the exception itself."""
+        from unittest.mock import MagicMock
+        from src.shortstory.utils import errors
+
+        mock_logger = MagicMock()
+        mock_logger.isEnabledFor.return_value = True
+        monkeypatch.setattr(errors, "logger", mock_logger)
+        error = ValueError("loud")
+
+        errors._log_error(error)
+
+        args, kwargs = mock_logger.error.call_args
+        assert args == ("Error: %s: %s", "ValueError", error)
+        assert kwargs["exc_info"] is error
+
+
+class TestJsonResponse:
+    """Test JSON serialization of error payloads."""
+
+    def test_json_response_with_orjson(self):
+        """Test that orjson responses are newline-terminated JSON."""
+        from flask import Flask
+        from src.shortstory.utils import errors
+
+        if not errors.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        with Flask(__name__).app_context():
+            response, status = errors._json_response({"error": "x", "details": {1: "a"}}, 418)
+
+        assert status == 418
+        assert response.mimetype == "application/json"
+        assert response.get_data().endswith(b"\n")
+        assert response.get_json() == {"error": "x", "details": {"1": "a"}}
+
+    def test_json_response_falls_back_to_jsonify(self, monkeypatch):
+        """Test that jsonify is used when orjson is unavailable."""
+        from flask import Flask
+        from src.shortstory.utils import errors
+
+        monkeypatch.setattr(errors, "ORJSON_AVAILABLE", False)
+
+        with Flask(__name__).app_context():
+            response, status = errors._json_response({"error": "x"}, 400)
+
+        assert status == 400
+        assert response.get_json() == {"error": "x"}
@@ -92,6 +92,25 @@ def test_generate_outline_structure_no_theme():
     assert "end" in outline
 
 
+def test_template_outline_and_scaffold_do_not_create_client(monkeypatch):
+    """Test that the template outline and scaffold never set up an LLM client."""
+    from src.shortstory.utils import llm
+    from src.shortstory.genres import get_genre_config
+
+    def fail():
+        raise AssertionError("default client should not be created")
+
+    monkeypatch.setattr(llm, "get_default_client", fail)
+    premise = {"idea": "A lighthouse keeper collects lost voices.", "character": {}, "theme": ""}
+    genre_config = get_genre_config("Horror")
+
+    outline = llm.generate_outline_structure(premise, "Horror", genre_config)
+    scaffold = llm.generate_scaffold_structure(premise, outline, genre_config)
+
+    assert outline["framework"] == "tension_escalation"
+    assert scaffold["tone"] == "dark"
+
+
 def test_pipeline_generate_outline(pipeline_with_premise):
     """Test pipeline outline generation."""
     pipeline = pipeline_with_premise
@@ -138,6 +157,25 @@ def test_pipeline_generate_outline_with_genre(basic_pipeline):
     assert outline["framework"] == "mystery_arc"
 
 
+def test_resolve_outline_labels_is_cached_per_genre():
+    """Test that genre outline labels are resolved once and reused."""
+    from src.shortstory.pipeline import _resolve_outline_labels
+
+    labels = _resolve_outline_labels("Horror")
+
+    assert labels == (
+        ("setup", "rising dread", "twist ending"),
+        ("setup", "rising dread", "twist ending"),
+        "tension_escalation",
+    )
+    assert _resolve_outline_labels("Horror") is labels
+    assert _resolve_outline_labels(None) == (
+        ("setup", "complication", "resolution"),
+        ("setup", "complication", "resolution"),
+        "narrative_arc",
+    )
+
+
 def test_pipeline_generate_outline_requires_premise(basic_pipeline):
     """Test that outline generation requires a premise."""
     pipeline = basic_pipeline
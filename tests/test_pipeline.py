@@ -168,7 +168,16 @@ class TestRuleBasedRevisions:
         assert " very " not in revised_text
         # Replacement shouldn't create new clichés
         assert "because she was tired" in revised_text.lower() or "because she tired" in revised_text.lower()
-    
+
+    def test_apply_rule_based_revisions_vague_removal_completes_redundant_phrase(self, basic_pipeline):
+        """Test that redundant phrases exposed by removing vague words are replaced."""
+        pipeline = basic_pipeline
+        text = "It happened due to the very fact that the tide turned."
+
+        revised_text = pipeline._apply_rule_based_revisions(text, {})
+
+        assert revised_text == "It happened because the tide turned."
+
     def test_apply_rule_based_revisions_preserves_punctuation(self, basic_pipeline):
         """Test that rule-based revisions preserve punctuation correctly."""
         pipeline = basic_pipeline
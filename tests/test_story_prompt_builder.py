@@ -0,0 +1,134 @@
+"""
+Tests for story prompt building.
+"""
+
+from src.shortstory.utils.story_prompt_builder import (
+    StoryParams,
+    build_story_system_prompt,
+    build_story_user_prompt,
+    build_revision_system_prompt,
+    build_revision_user_prompt,
+)
+from src.shortstory.utils.llm_constants import STORY_MIN_WORDS, STORY_MAX_WORDS
+
+
+def _make_params(**overrides):
+    """Build StoryParams with sensible defaults for tests."""
+    values = {
+        "idea": "A lighthouse keeper who collects lost voices",
+        "char_desc": "A quiet keeper with salt-stained hands",
+        "char_name": "Mara",
+        "char_quirks": ["counts waves", "hums off-key"],
+        "char_contradictions": "Fears silence but lives alone",
+        "theme": "Memory and loss",
+        "beginning_label": "Discovery",
+        "middle_label": "Descent",
+        "end_label": "Return",
+        "pov": "third_limited",
+        "tone": "dark",
+        "pace": "deliberate",
+        "constraints": {"sensory_focus": ["sound"]},
+        "max_words": 6500,
+    }
+    values.update(overrides)
+    return StoryParams(**values)
+
+
+class TestSystemPrompts:
+    """Test system prompt construction."""
+
+    def test_story_system_prompt_is_shared(self):
+        """Test that the story system prompt is the same object on every call."""
+        assert build_story_system_prompt() is build_story_system_prompt()
+
+    def test_story_system_prompt_includes_word_limits(self):
+        """Test that word count limits are formatted into the system prompt."""
+        prompt = build_story_system_prompt()
+        assert f"at least {STORY_MIN_WORDS:,} words" in prompt
+        assert f"{STORY_MAX_WORDS:,} words" in prompt
+
+    def test_revision_system_prompt_is_shared(self):
+        """Test that the revision system prompt is the same object on every call."""
+        assert build_revision_system_prompt() is build_revision_system_prompt()
+
+
+class TestStoryUserPrompt:
+    """Test story user prompt construction."""
+
+    def test_user_prompt_includes_story_details(self):
+        """Test that the user prompt carries idea, character and structure."""
+        prompt, min_words, max_words, target_words = build_story_user_prompt(_make_params())
+
+        assert "A lighthouse keeper who collects lost voices" in prompt
+        assert "- Name: Mara" in prompt
+        assert "- Quirks: counts waves, hums off-key" in prompt
+        assert "- Beginning: Discovery" in prompt
+        assert "- Sensory Details: Emphasize: sound" in prompt
+        assert min_words == STORY_MIN_WORDS
+        assert max_words == STORY_MAX_WORDS
+        assert target_words == int(6500 * 0.75)
+
+    def test_user_prompt_omits_empty_optional_sections(self):
+        """Test that empty theme, quirks and constraints are left out."""
+        prompt, _, _, _ = build_story_user_prompt(
+            _make_params(theme="", char_quirks=[], char_contradictions="", constraints={})
+        )
+
+        assert "**Theme:**" not in prompt
+        assert "- Quirks:" not in prompt
+        assert "- Contradictions:" not in prompt
+        assert "**Genre-Specific Guidance:**" not in prompt
+
+    def test_user_prompt_has_no_unformatted_placeholders(self):
+        """Test that the word count target is formatted and user braces are kept."""
+        prompt, _, _, target_words = build_story_user_prompt(
+            _make_params(idea="A cipher written as {key} on the wall")
+        )
+
+        assert "{target_words" not in prompt
+        assert f"- TARGET: Aim for {target_words:,} words" in prompt
+        assert "A cipher written as {key} on the wall" in prompt
+
+
+class TestRevisionUserPrompt:
+    """Test revision user prompt construction."""
+
+    def test_revision_prompt_includes_story_and_notes(self):
+        """Test that the revision prompt carries the story and numbered notes."""
+        prompt, _, _, _ = build_revision_user_prompt(
+            text="Once upon a time.",
+            revision_notes=["Sharpen the ending", "Cut adverbs"],
+            current_words=4500,
+            max_words=6500,
+        )
+
+        assert "Once upon a time." in prompt
+        assert "1. Sharpen the ending" in prompt
+        assert "2. Cut adverbs" in prompt
+        assert "**Revision Requirements:**" in prompt
+
+    def test_revision_prompt_requests_expansion_for_short_story(self):
+        """Test that short stories are asked to expand to the minimum."""
+        prompt, _, _, _ = build_revision_user_prompt(
+            text="Short.",
+            revision_notes=[],
+            current_words=1000,
+            max_words=6500,
+        )
+
+        assert f"at least {STORY_MIN_WORDS:,} words" in prompt
+        assert "**Revision Instructions:**" not in prompt
+
+    def test_revision_prompt_keeps_braces_in_story_text(self):
+        """Test that braces in the story are passed through, not formatted."""
+        prompt, _, _, _ = build_revision_user_prompt(
+            text="She wrote {current_words} and {0} on the glass.",
+            revision_notes=["Keep the {note} literal"],
+            current_words=4500,
+            max_words=6500,
+        )
+
+        assert "She wrote {current_words} and {0} on the glass." in prompt
+        assert "1. Keep the {note} literal" in prompt
+        assert "{length_instruction}" not in prompt
+        assert "{final_instruction}" not in prompt
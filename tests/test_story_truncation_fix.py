@@ -18,6 +18,11 @@ sys.path.insert(0, str(project_root))
 
 from src.shortstory.utils.llm import (
     _continue_story_if_needed,
+    _strip_metadata_from_story,
+    _count_words,
+    _last_words,
+    _ends_with_terminal,
+    _CLOSURE_CHARACTERS,
 )
 from src.shortstory.utils.llm_constants import (
     STORY_MIN_WORDS,
@@ -28,6 +33,86 @@ from src.shortstory.utils.llm_constants import (
 )
 
 
+class TestTruncationDetection:
+    """Test detection of stories that end mid-sentence."""
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("The door closed.", True),
+        ("She whispered, \"Go.\"  \n\n", True),
+        ("Was it over?\n", True),
+        ("He never came back…", True),
+        ("She said, “Go.”", True),
+        ("(The end.)", True),
+        ("«Fin»", True),
+        ("\"Wait, I never—\"", True),
+        ("And then she was gone—", True),
+        ("The door closed and", False),
+        ("   \n", False),
+        ("", False),
+    ])
+    def test_ends_with_terminal(self, text, expected):
+        """Test sentence-ending detection ignoring trailing whitespace."""
+        assert _ends_with_terminal(text) is expected
+    
+    def test_ends_with_terminal_custom_set(self):
+        """Test that looser closure characters can be accepted."""
+        assert _ends_with_terminal("and then;", _CLOSURE_CHARACTERS)
+        assert not _ends_with_terminal("and then;")
+    
+    def test_draft_near_target_is_not_continued(self, caplog):
+        """Test that a draft close to its target skips the continuation but is flagged."""
+        import logging
+        from src.shortstory.utils.llm import _finalize_story_draft
+        
+        client = MagicMock()
+        story = "The keeper climbed the stairs " * 1100 + "and the light"
+        
+        with caplog.at_level(logging.WARNING, logger="src.shortstory.utils.llm"):
+            result = _finalize_story_draft(story, STORY_MIN_WORDS, 5625, 7500, 8192, client)
+        
+        assert not client.generate.called
+        assert result == story
+        assert "Accepting draft that ends mid-sentence" in caplog.text
+
+
+class TestWordCountHelpers:
+    """Test the word counting helpers used during continuation."""
+    
+    @pytest.mark.parametrize("text", [
+        "",
+        "one",
+        "  leading and trailing  ",
+        "Paragraph one.\n\nParagraph two,\tstill going.",
+    ])
+    def test_count_words_matches_split(self, text):
+        """Test that counting treats any whitespace as a word boundary."""
+        assert _count_words(text) == len(text.split())
+        assert _count_words(None) == 0
+    
+    @pytest.mark.parametrize("count", [1, 3, 10])
+    def test_last_words_matches_split_tail(self, count):
+        """Test that the tail matches joining the last words of a full split."""
+        text = "  The keeper\nclimbed the\n\nstairs and   lit the lamp.  "
+        assert _last_words(text, count) == " ".join(text.split()[-count:])
+
+
+class TestMetadataStripping:
+    """Test removal of metadata headers from generated stories."""
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("# Story\n\nThe keeper woke.", "The keeper woke."),
+        ("  ## narrative  \nThe keeper woke.", "The keeper woke."),
+        ("**Story**: draft one\nThe keeper woke.", "The keeper woke."),
+        ("The keeper woke.\nStory: notes\n\n\nShe climbed.", "The keeper woke.\n\nShe climbed."),
+        ("The story: a keeper wakes.", "The story: a keeper wakes."),
+        ("# Storytime\nThe keeper woke.", "# Storytime\nThe keeper woke."),
+        ("  The keeper woke.\n\nShe climbed.  \n", "The keeper woke.\n\nShe climbed."),
+    ])
+    def test_strip_metadata(self, text, expected):
+        """Test that header lines and one following blank line are dropped."""
+        assert _strip_metadata_from_story(text) == expected
+
+
 class TestContinuationTokenAllocation:
     """Test that continuation gets sufficient and precise tokens."""
     
@@ -72,6 +157,25 @@ class TestContinuationTokenAllocation:
                 f"Calculation: remaining_words={remaining_words}, continuation_tokens_needed={continuation_tokens_needed}, " \
                 f"after_min={min(GEMINI_MAX_OUTPUT_TOKENS, estimated_max_tokens, continuation_tokens_needed)}, " \
                 f"after_max={max(DEFAULT_MIN_TOKENS, min(GEMINI_MAX_OUTPUT_TOKENS, estimated_max_tokens, continuation_tokens_needed))}"
+    
+    def test_continuation_system_prompt_is_static(self):
+        """Test that every continuation attempt sends the same system prompt."""
+        client = MagicMock()
+        client.generate.return_value = "More of the story without an ending"
+        
+        _continue_story_if_needed(
+            "This is a short story. " * 20,
+            STORY_MIN_WORDS,
+            STORY_MAX_WORDS,
+            6000,
+            client,
+            max_continuation_attempts=3,
+        )
+        
+        system_prompts = {c.kwargs["system_prompt"] for c in client.generate.call_args_list}
+        assert client.generate.call_count == 3
+        assert len(system_prompts) == 1
+        assert f"{STORY_MIN_WORDS:,}" not in system_prompts.pop()
 
 
 class TestRealWorldScenario:
@@ -261,3 +261,24 @@ class TestTemplateDraftGeneration:
         draft_lower = draft.lower()
         assert any(keyword in draft_lower for keyword in idea_keywords) or self.idea in draft, \
             f"Draft should contain the story idea or key words from it: {idea_keywords}"
+    
+    def test_generate_template_draft_stops_at_target_length(self):
+        """Test that expansion stops once the target word count is reached."""
+        # A long idea puts the draft just under the target before expansion
+        long_idea = " ".join([self.idea] * 200)
+        draft = self.pipeline._generate_template_draft(
+            long_idea,
+            self.character,
+            self.theme,
+            self.outline,
+            self.scaffold
+        )
+        
+        count_words = self.pipeline.word_validator.count_words
+        target_words = max(2000, int(self.pipeline.word_validator.max_words * 0.3))
+        word_count = count_words(draft)
+        assert word_count >= target_words
+        
+        # Dropping the last appended paragraph must fall back under the target
+        last_paragraph_start = draft.rstrip().rfind("\n\n")
+        assert count_words(draft[:last_paragraph_start]) < target_words